@@ -9,12 +9,29 @@ from .transcribe import TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Known Whisper hallucinations leaking from subtitle/YouTube training data.
+# Matched case-insensitively as substrings of the transcript.
+BOILERPLATE_BLACKLIST: tuple[str, ...] = (
+    "subscribe to my channel",
+    "thanks for watching",
+    "thank you for watching",
+    "subtitles by",
+    "продолжение следует",
+    "подписывайтесь на канал",
+    "спасибо за просмотр",
+    "субтитры сделал",
+    "субтитры создавал",
+    "редактор субтитров",
+    "dimatorzok",
+)
+
 
 @dataclass
 class HeuristicsDecision:
     """Decision from heuristics analysis."""
     needs_accurate_pass: bool
     reasons: list[str]
+    rejected: bool = False  # Obvious hallucination, don't escalate
 
 
 def check_needs_accurate_pass(
@@ -24,6 +41,9 @@ def check_needs_accurate_pass(
     """
     Analyze transcription result and decide if accurate pass is needed.
 
+    Rejects the transcript (no accurate pass) if it is an obvious
+    hallucination: a repetition loop or known subtitle boilerplate.
+
     Triggers accurate pass if:
     1. avg_logprob is below threshold (low confidence)
     2. Text is suspiciously short for the audio duration
@@ -39,6 +59,25 @@ def check_needs_accurate_pass(
     settings = get_settings()
     reasons = []
 
+    # Obvious hallucinations are rejected outright: re-running the
+    # (much slower) accurate model on looping or boilerplate output
+    # rarely recovers real speech.
+    rejection_reasons = detect_hallucination(result.text)
+    if rejection_reasons:
+        logger.info(
+            "Transcript rejected as hallucination",
+            extra={
+                "reasons": rejection_reasons,
+                "text_length": len(result.text),
+                "audio_duration_sec": audio_duration_sec,
+            },
+        )
+        return HeuristicsDecision(
+            needs_accurate_pass=False,
+            reasons=rejection_reasons,
+            rejected=True,
+        )
+
     # Skip accurate pass for very short audio
     if audio_duration_sec < settings.min_duration_for_accurate:
         logger.debug(
@@ -95,6 +134,50 @@ def check_needs_accurate_pass(
     )
 
 
+def detect_hallucination(text: str) -> list[str]:
+    """
+    Detect Whisper's common failure modes without re-running inference.
+
+    Checks for:
+    - Looping output (the same n-gram repeated many times)
+    - Subtitle/YouTube boilerplate leaking from training data
+
+    Returns list of reasons (empty if text looks legitimate).
+    """
+    reasons = []
+
+    max_repeats = _detect_ngram_loop(text)
+    if max_repeats:
+        reasons.append(f"Repetition loop: n-gram repeated {max_repeats} times")
+
+    lowered = text.lower()
+    for phrase in BOILERPLATE_BLACKLIST:
+        if phrase in lowered:
+            reasons.append(f"Boilerplate phrase: {phrase!r}")
+            break
+
+    return reasons
+
+
+def _detect_ngram_loop(text: str, n: int = 4, threshold: int = 3) -> int:
+    """
+    Find the most repeated word n-gram in the text.
+
+    Returns the repeat count if it exceeds threshold, otherwise 0.
+    """
+    words = text.lower().split()
+    if len(words) < n + threshold:
+        return 0
+
+    counts: dict[tuple[str, ...], int] = {}
+    for i in range(len(words) - n + 1):
+        ngram = tuple(words[i:i + n])
+        counts[ngram] = counts.get(ngram, 0) + 1
+
+    max_repeats = max(counts.values())
+    return max_repeats if max_repeats > threshold else 0
+
+
 def _calculate_garbage_score(text: str) -> float:
     """
     Calculate a "garbage" score for the text.
@@ -81,7 +81,13 @@ async def process_dialogue(
         # 5. Check if accurate pass is needed
         decision = check_needs_accurate_pass(fast_result, audio_duration_sec)
 
-        if decision.needs_accurate_pass:
+        if decision.rejected:
+            # 6a. Hallucinated output - keep it for inspection but don't
+            # spend an accurate pass on it or send it to analysis
+            final_result = fast_result
+            asr_time = fast_timer.elapsed
+            pass_type = "fast"
+        elif decision.needs_accurate_pass:
             # 6. Accurate pass transcription
             with Timer() as accurate_timer:
                 final_result = transcribe_audio(audio_path, model_type="accurate")
@@ -100,6 +106,7 @@ async def process_dialogue(
             extra={
                 "dialogue_id": str(dialogue_id),
                 "pass_type": pass_type,
+                "rejected": decision.rejected,
                 "model": final_result.model_name,
                 "asr_time_sec": round(asr_time, 3),
                 "audio_duration_sec": round(audio_duration_sec, 2),
@@ -120,11 +127,12 @@ async def process_dialogue(
                 no_speech_prob=final_result.no_speech_prob,
             )
 
-            # 8. Update dialogue status to DONE
+            # 8. Update dialogue status to DONE (or REJECTED for hallucinations)
             await repository.update_dialogue_asr_status(
                 session,
                 dialogue_id=dialogue_id,
-                status="DONE",
+                status="REJECTED" if decision.rejected else "DONE",
+                error_message="; ".join(decision.reasons) if decision.rejected else None,
                 asr_pass=pass_type,
                 asr_model=final_result.model_name,
             )
@@ -264,8 +272,10 @@ async def run_worker() -> None:
             "batch_size": settings.batch_size,
             "whisper_model_fast": settings.whisper_model_fast,
             "whisper_model_accurate": settings.whisper_model_accurate,
+            "whisper_device": settings.whisper_device,
             "whisper_compute_type": settings.whisper_compute_type,
             "whisper_threads": settings.whisper_threads,
+            "whisper_num_workers": settings.whisper_num_workers,
             "asr_stuck_timeout_sec": settings.asr_stuck_timeout_sec,
             "ingest_internal_base_url": settings.ingest_internal_base_url,
         },
@@ -87,6 +87,28 @@ async def update_dialogue_asr_status(
                 "asr_model": asr_model,
             },
         )
+    elif status == "REJECTED":
+        query = text("""
+            UPDATE dialogues
+            SET asr_status = :status,
+                asr_finished_at = :now,
+                asr_pass = :asr_pass,
+                asr_model = :asr_model,
+                asr_error_message = :error_message,
+                asr_processing_started_at = NULL
+            WHERE dialogue_id = :dialogue_id
+        """)
+        await session.execute(
+            query,
+            {
+                "dialogue_id": dialogue_id,
+                "status": status,
+                "now": now,
+                "asr_pass": asr_pass,
+                "asr_model": asr_model,
+                "error_message": error_message,
+            },
+        )
     elif status == "ERROR":
         query = text("""
             UPDATE dialogues
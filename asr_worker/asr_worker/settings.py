@@ -27,9 +27,12 @@ class Settings(BaseSettings):
     # Whisper model settings
     whisper_model_fast: str = "base"
     whisper_model_accurate: str = "small"
-    whisper_compute_type: str = "int8"
-    whisper_threads: int = 8
+    whisper_device: str = "cpu"  # cpu, cuda or auto
+    whisper_compute_type: str = "auto"  # auto picks int8 on CPU, float16 on GPU
+    whisper_threads: int = 8  # intra-op threads per worker
+    whisper_num_workers: int = 2  # inter-op workers sharing one weight copy
     whisper_cache_dir: str = "/models"
+    whisper_offline: bool = False  # Set once models are cached to skip HF hub lookups
     beam_size: int = 5
     language: str = "ru"
 
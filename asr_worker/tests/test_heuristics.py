@@ -11,7 +11,9 @@ os.environ["INTERNAL_TOKEN"] = "test-token"
 from asr_worker.heuristics import (
     HeuristicsDecision,
     _calculate_garbage_score,
+    _detect_ngram_loop,
     check_needs_accurate_pass,
+    detect_hallucination,
 )
 from asr_worker.transcribe import TranscriptionResult
 
@@ -49,6 +51,36 @@ class TestGarbageScore:
         assert score > 0.1
 
 
+class TestHallucinationDetection:
+    """Tests for detect_hallucination and _detect_ngram_loop functions."""
+
+    def test_normal_text_not_flagged(self):
+        """Normal dialogue should not be flagged."""
+        text = "Здравствуйте, мне капучино пожалуйста. Хотите добавить круассан? Да, давайте."
+        assert detect_hallucination(text) == []
+
+    def test_ngram_loop_detected(self):
+        """Looping output should be detected."""
+        text = "спасибо за покупку приходите еще " * 6
+        assert _detect_ngram_loop(text) > 3
+        reasons = detect_hallucination(text)
+        assert any("repetition" in r.lower() for r in reasons)
+
+    def test_few_repeats_not_flagged(self):
+        """A phrase repeated a couple of times is normal speech."""
+        text = "один капучино пожалуйста " * 2 + "и еще чай"
+        assert _detect_ngram_loop(text) == 0
+
+    def test_boilerplate_detected(self):
+        """Subtitle boilerplate should be detected."""
+        reasons = detect_hallucination("Субтитры сделал DimaTorzok")
+        assert any("boilerplate" in r.lower() for r in reasons)
+
+    def test_english_boilerplate_detected(self):
+        """English boilerplate is matched case-insensitively."""
+        assert detect_hallucination("Thanks for watching! Subscribe to my channel")
+
+
 class TestCheckNeedsAccuratePass:
     """Tests for check_needs_accurate_pass function."""
 
@@ -130,6 +162,22 @@ class TestCheckNeedsAccuratePass:
         assert decision.needs_accurate_pass is True
         assert any("no_speech" in r.lower() for r in decision.reasons)
 
+    def test_hallucination_rejected_without_accurate_pass(self):
+        """Looping output is rejected instead of escalating to accurate pass."""
+        result = TranscriptionResult(
+            text="Продолжение следует. " * 10,
+            segments=[],
+            language="ru",
+            avg_logprob=-0.9,  # Would otherwise trigger accurate pass
+            no_speech_prob=0.1,
+            model_name="base",
+        )
+
+        decision = check_needs_accurate_pass(result, audio_duration_sec=30.0)
+
+        assert decision.rejected is True
+        assert decision.needs_accurate_pass is False
+
 
 class TestHeuristicsDecision:
     """Tests for HeuristicsDecision dataclass."""
@@ -152,4 +200,5 @@ class TestHeuristicsDecision:
         )
 
         assert decision.needs_accurate_pass is False
+        assert decision.rejected is False
         assert len(decision.reasons) == 0
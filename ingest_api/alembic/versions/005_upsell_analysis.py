@@ -21,40 +21,19 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add analysis fields to dialogues table
-    op.add_column(
-        "dialogues",
-        sa.Column(
-            "analysis_status",
-            sa.Text(),
-            nullable=False,
-            server_default="PENDING",
-        ),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_processing_started_at", sa.DateTime(timezone=True), nullable=True),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_started_at", sa.DateTime(timezone=True), nullable=True),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_finished_at", sa.DateTime(timezone=True), nullable=True),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_error_message", sa.Text(), nullable=True),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_model", sa.Text(), nullable=True),
-    )
-    op.add_column(
-        "dialogues",
-        sa.Column("analysis_prompt_version", sa.Text(), nullable=True),
-    )
+    # Add analysis fields to dialogues table in a single ALTER TABLE: one
+    # ACCESS EXCLUSIVE lock and catalog pass instead of seven. A constant
+    # default does not rewrite the table (PostgreSQL 11+)
+    op.execute("""
+        ALTER TABLE dialogues
+            ADD COLUMN analysis_status TEXT NOT NULL DEFAULT 'PENDING',
+            ADD COLUMN analysis_processing_started_at TIMESTAMP WITH TIME ZONE,
+            ADD COLUMN analysis_started_at TIMESTAMP WITH TIME ZONE,
+            ADD COLUMN analysis_finished_at TIMESTAMP WITH TIME ZONE,
+            ADD COLUMN analysis_error_message TEXT,
+            ADD COLUMN analysis_model TEXT,
+            ADD COLUMN analysis_prompt_version TEXT
+    """)
 
     # Index for efficient polling of PENDING dialogues for analysis
     op.create_index(
@@ -169,10 +148,13 @@ def downgrade() -> None:
     op.drop_index("ix_dialogue_upsell_analysis_dialogue_id", table_name="dialogue_upsell_analysis")
     op.drop_table("dialogue_upsell_analysis")
     op.drop_index("ix_dialogues_analysis_status", table_name="dialogues")
-    op.drop_column("dialogues", "analysis_prompt_version")
-    op.drop_column("dialogues", "analysis_model")
-    op.drop_column("dialogues", "analysis_error_message")
-    op.drop_column("dialogues", "analysis_finished_at")
-    op.drop_column("dialogues", "analysis_started_at")
-    op.drop_column("dialogues", "analysis_processing_started_at")
-    op.drop_column("dialogues", "analysis_status")
+    op.execute("""
+        ALTER TABLE dialogues
+            DROP COLUMN analysis_prompt_version,
+            DROP COLUMN analysis_model,
+            DROP COLUMN analysis_error_message,
+            DROP COLUMN analysis_finished_at,
+            DROP COLUMN analysis_started_at,
+            DROP COLUMN analysis_processing_started_at,
+            DROP COLUMN analysis_status
+    """)
@@ -0,0 +1,51 @@
+"""Replace full asr_status index with partial indexes for ASR worker polling.
+
+The ASR worker only ever looks for PENDING dialogues (ordered by start_ts)
+and the recovery sweeper only for PROCESSING ones. Once most dialogues are in
+a terminal state, a btree over every asr_status value is mostly dead weight,
+so it is replaced with two small partial indexes matching those queries.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Poll query: WHERE asr_status = 'PENDING' ORDER BY start_ts LIMIT N
+    op.create_index(
+        "ix_dialogues_asr_pending",
+        "dialogues",
+        ["start_ts"],
+        postgresql_where=sa.text("asr_status = 'PENDING'"),
+    )
+
+    # Stuck recovery: WHERE asr_status = 'PROCESSING' AND asr_processing_started_at < ...
+    op.create_index(
+        "ix_dialogues_asr_stuck",
+        "dialogues",
+        ["asr_processing_started_at"],
+        postgresql_where=sa.text("asr_status = 'PROCESSING'"),
+    )
+
+    op.drop_index("ix_dialogues_asr_status", table_name="dialogues")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_dialogues_asr_status",
+        "dialogues",
+        ["asr_status"],
+    )
+    op.drop_index("ix_dialogues_asr_stuck", table_name="dialogues")
+    op.drop_index("ix_dialogues_asr_pending", table_name="dialogues")
@@ -0,0 +1,48 @@
+"""Compress dialogue_transcripts.segments_json with lz4.
+
+segments_json holds per-segment ASR output (10-200KB for multi-minute
+dialogues) and is always TOASTed. lz4 compresses noticeably faster than the
+default pglz at a similar ratio, which shortens the ASR worker's commit path.
+Requires PostgreSQL 14+ built with lz4 (the official images are); on other
+servers the column keeps pglz. Only newly written values use the new method.
+
+The column is write-mostly and read by dialogue_id, so it deliberately has
+no GIN index.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DO $$
+        BEGIN
+            ALTER TABLE dialogue_transcripts ALTER COLUMN segments_json SET COMPRESSION lz4;
+        EXCEPTION WHEN feature_not_supported THEN
+            RAISE NOTICE 'lz4 not supported by this server, keeping pglz';
+        END
+        $$
+    """)
+    op.execute(
+        "COMMENT ON COLUMN dialogue_transcripts.segments_json IS "
+        "'Write-mostly ASR segments, read by dialogue_id only. "
+        "Do not add a GIN index; use a materialized view for segment-level search.'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("COMMENT ON COLUMN dialogue_transcripts.segments_json IS NULL")
+    op.execute(
+        "ALTER TABLE dialogue_transcripts ALTER COLUMN segments_json SET COMPRESSION pglz"
+    )
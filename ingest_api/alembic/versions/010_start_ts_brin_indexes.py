@@ -0,0 +1,50 @@
+"""Add BRIN indexes on start_ts for time-range analytics.
+
+audio_chunks and dialogues are append-mostly, so start_ts correlates with
+physical row order and a BRIN index is a tiny fraction of a btree's size.
+Every analytics query filters dialogues by a start_ts range first, with
+point_id as a residual filter, so ix_dialogues_point_start is dropped to cut
+write amplification. The device-filtered (device_id, start_ts) btrees stay.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dialogues_start_ts_brin",
+        "dialogues",
+        ["start_ts"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_audio_chunks_start_ts_brin",
+        "audio_chunks",
+        ["start_ts"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+    op.drop_index("ix_dialogues_point_start", table_name="dialogues")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_dialogues_point_start",
+        "dialogues",
+        ["point_id", "start_ts"],
+    )
+    op.drop_index("ix_audio_chunks_start_ts_brin", table_name="audio_chunks")
+    op.drop_index("ix_dialogues_start_ts_brin", table_name="dialogues")
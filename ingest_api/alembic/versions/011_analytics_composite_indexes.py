@@ -0,0 +1,86 @@
+"""Replace the analysis_status index with composite indexes for analytics.
+
+Every analytics query is a start_ts range over transcribed dialogues with an
+analysis_status filter (optionally per point). The single-column
+analysis_status index has a handful of distinct values and cannot serve the
+range, so it is replaced with:
+
+- (start_ts, analysis_status) WHERE asr_status = 'DONE': analytics range
+  scans and the analysis worker poll (PENDING, ordered by start_ts);
+- (point_id, start_ts) WHERE analysis_status = 'DONE': per-point dashboards;
+- (analysis_processing_started_at) WHERE analysis_status = 'PROCESSING':
+  stuck recovery, mirroring ix_dialogues_asr_stuck.
+
+Indexes are built CONCURRENTLY outside the migration transaction so ingest
+keeps writing to dialogues while they build.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_start_ts_status",
+            "dialogues",
+            ["start_ts", "analysis_status"],
+            postgresql_where=sa.text("asr_status = 'DONE'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_dialogues_point_start_status",
+            "dialogues",
+            ["point_id", "start_ts"],
+            postgresql_where=sa.text("analysis_status = 'DONE'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_dialogues_analysis_stuck",
+            "dialogues",
+            ["analysis_processing_started_at"],
+            postgresql_where=sa.text("analysis_status = 'PROCESSING'"),
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_dialogues_analysis_status",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_analysis_status",
+            "dialogues",
+            ["analysis_status"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_analysis_stuck",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_point_start_status",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_start_ts_status",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,97 @@
+"""Materialize upsell categories into a sibling table.
+
+The daily analytics unnest dialogue_upsell_analysis.categories with
+jsonb_array_elements_text, which the GIN index from 005 cannot serve, so every
+analysis write paid GIN maintenance for nothing. Categories are now kept in
+dialogue_upsell_analysis_categories (one row per dialogue/category, btree on
+category), maintained by a trigger on dialogue_upsell_analysis so the analysis
+worker's upsert stays unchanged. The unused GIN index is dropped.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dialogue_upsell_analysis_categories",
+        sa.Column("dialogue_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("category", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("dialogue_id", "category"),
+        sa.ForeignKeyConstraint(
+            ["dialogue_id"],
+            ["dialogue_upsell_analysis.dialogue_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    # Index for GROUP BY / filtering by category
+    op.create_index(
+        "ix_dialogue_upsell_analysis_categories_category",
+        "dialogue_upsell_analysis_categories",
+        ["category"],
+    )
+
+    # Keep the sibling table in sync with dialogue_upsell_analysis.categories
+    op.execute("""
+        CREATE FUNCTION sync_upsell_analysis_categories() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM dialogue_upsell_analysis_categories
+                WHERE dialogue_id = OLD.dialogue_id;
+            END IF;
+            INSERT INTO dialogue_upsell_analysis_categories (dialogue_id, category)
+            SELECT DISTINCT NEW.dialogue_id, c
+            FROM jsonb_array_elements_text(NEW.categories) AS c;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogue_upsell_analysis_categories
+        AFTER INSERT OR UPDATE OF categories ON dialogue_upsell_analysis
+        FOR EACH ROW EXECUTE FUNCTION sync_upsell_analysis_categories()
+    """)
+
+    # Backfill existing analyses
+    op.execute("""
+        INSERT INTO dialogue_upsell_analysis_categories (dialogue_id, category)
+        SELECT DISTINCT dua.dialogue_id, c
+        FROM dialogue_upsell_analysis dua,
+             jsonb_array_elements_text(dua.categories) AS c
+    """)
+
+    op.drop_index(
+        "ix_dialogue_upsell_analysis_categories",
+        table_name="dialogue_upsell_analysis",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_dialogue_upsell_analysis_categories",
+        "dialogue_upsell_analysis",
+        ["categories"],
+        postgresql_using="gin",
+    )
+    op.execute(
+        "DROP TRIGGER trg_dialogue_upsell_analysis_categories ON dialogue_upsell_analysis"
+    )
+    op.execute("DROP FUNCTION sync_upsell_analysis_categories()")
+    op.drop_index(
+        "ix_dialogue_upsell_analysis_categories_category",
+        table_name="dialogue_upsell_analysis_categories",
+    )
+    op.drop_table("dialogue_upsell_analysis_categories")
@@ -0,0 +1,37 @@
+"""Index device_dialogue_state.open_dialogue_id.
+
+PostgreSQL does not index the referencing side of a foreign key. An audit of
+every FK showed this was the only one without a leading-column index, so each
+dialogue delete (ON DELETE SET NULL) had to scan device_dialogue_state. Most
+devices have no open dialogue, hence the partial index.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_device_dialogue_state_open_dialogue_id",
+        "device_dialogue_state",
+        ["open_dialogue_id"],
+        postgresql_where=sa.text("open_dialogue_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_device_dialogue_state_open_dialogue_id",
+        table_name="device_dialogue_state",
+    )
@@ -0,0 +1,276 @@
+"""Add hourly analytics rollup tables maintained by triggers.
+
+The daily analytics endpoint used to aggregate dialogues x upsell analysis on
+every dashboard hit, although a past day's numbers never change. Counts are
+now kept per (day, point_id, hour) in dialogue_daily_rollup and per
+(day, point_id, category) in dialogue_daily_category_rollup, so the endpoint
+sums at most 24 rows per point.
+
+Both tables are maintained incrementally: dialogue_rollup_apply() adds (+1) or
+removes (-1) one dialogue's contribution with INSERT ... ON CONFLICT DO UPDATE,
+and triggers on dialogues and dialogue_upsell_analysis call it with the old and
+new row versions. Only transcribed (asr_status = 'DONE') dialogues count,
+bucketed by their UTC start_ts day and hour, matching the previous query.
+
+The dialogues delete trigger runs BEFORE DELETE so the analysis row is still
+visible; the cascaded analysis delete then finds no dialogue and is a no-op.
+
+The category rollup replaces dialogue_upsell_analysis_categories (012), which
+nothing reads any more, so that table and the trigger keeping it in sync on
+every analysis write are dropped.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_COUNTERS = (
+    "dialogues_total",
+    "dialogues_analyzed",
+    "dialogues_skipped",
+    "dialogues_error",
+    "analyses_total",
+    "attempted_yes",
+    "attempted_no",
+    "attempted_uncertain",
+    "quality_sum",
+    "quality_0",
+    "quality_1",
+    "quality_2",
+    "quality_3",
+    "accepted",
+    "rejected",
+    "unclear",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dialogue_daily_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("point_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("hour", sa.SmallInteger(), nullable=False),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in ROLLUP_COUNTERS
+        ),
+        sa.PrimaryKeyConstraint("day", "point_id", "hour"),
+    )
+
+    op.create_table(
+        "dialogue_daily_category_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("point_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("category", sa.Text(), nullable=False),
+        sa.Column("dialogues", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "point_id", "category"),
+    )
+
+    update_counters = ",\n                ".join(
+        f"{name} = r.{name} + EXCLUDED.{name}" for name in ROLLUP_COUNTERS
+    )
+    op.execute(f"""
+        CREATE FUNCTION dialogue_rollup_apply(
+            d dialogues, a dialogue_upsell_analysis, sign integer
+        ) RETURNS void AS $$
+        DECLARE
+            v_day date := (d.start_ts AT TIME ZONE 'UTC')::date;
+            v_hour smallint := EXTRACT(HOUR FROM d.start_ts AT TIME ZONE 'UTC');
+            v_analyzed boolean;
+        BEGIN
+            IF d.asr_status IS DISTINCT FROM 'DONE' THEN
+                RETURN;
+            END IF;
+            v_analyzed := d.analysis_status = 'DONE' AND a.dialogue_id IS NOT NULL;
+
+            INSERT INTO dialogue_daily_rollup AS r (
+                day, point_id, hour, {", ".join(ROLLUP_COUNTERS)}
+            ) VALUES (
+                v_day, d.point_id, v_hour,
+                sign,
+                sign * (d.analysis_status = 'DONE')::int,
+                sign * (d.analysis_status = 'SKIPPED')::int,
+                sign * (d.analysis_status = 'ERROR')::int,
+                sign * v_analyzed::int,
+                sign * (v_analyzed AND a.attempted = 'yes')::int,
+                sign * (v_analyzed AND a.attempted = 'no')::int,
+                sign * (v_analyzed AND a.attempted = 'uncertain')::int,
+                CASE WHEN v_analyzed THEN sign * a.quality_score ELSE 0 END,
+                sign * (v_analyzed AND a.quality_score = 0)::int,
+                sign * (v_analyzed AND a.quality_score = 1)::int,
+                sign * (v_analyzed AND a.quality_score = 2)::int,
+                sign * (v_analyzed AND a.quality_score = 3)::int,
+                sign * (v_analyzed AND a.customer_reaction = 'accepted')::int,
+                sign * (v_analyzed AND a.customer_reaction = 'rejected')::int,
+                sign * (v_analyzed AND a.customer_reaction = 'unclear')::int
+            )
+            ON CONFLICT (day, point_id, hour) DO UPDATE SET
+                {update_counters};
+
+            IF v_analyzed THEN
+                INSERT INTO dialogue_daily_category_rollup AS r (
+                    day, point_id, category, dialogues
+                )
+                SELECT DISTINCT v_day, d.point_id, c, sign
+                FROM jsonb_array_elements_text(a.categories) AS c
+                ON CONFLICT (day, point_id, category) DO UPDATE SET
+                    dialogues = r.dialogues + EXCLUDED.dialogues;
+            END IF;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE FUNCTION dialogues_rollup_trigger() RETURNS trigger AS $$
+        DECLARE
+            a dialogue_upsell_analysis;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM dialogue_rollup_apply(NEW, NULL, 1);
+                RETURN NULL;
+            END IF;
+
+            SELECT * INTO a FROM dialogue_upsell_analysis
+            WHERE dialogue_id = OLD.dialogue_id;
+            PERFORM dialogue_rollup_apply(OLD, a, -1);
+
+            IF TG_OP = 'DELETE' THEN
+                RETURN OLD;
+            END IF;
+            PERFORM dialogue_rollup_apply(NEW, a, 1);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogues_rollup
+        AFTER INSERT OR UPDATE OF start_ts, point_id, asr_status, analysis_status
+        ON dialogues
+        FOR EACH ROW EXECUTE FUNCTION dialogues_rollup_trigger()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogues_rollup_delete
+        BEFORE DELETE ON dialogues
+        FOR EACH ROW EXECUTE FUNCTION dialogues_rollup_trigger()
+    """)
+
+    # FOR SHARE serializes with a concurrent status update of the same
+    # dialogue, so each side sees the other's committed row
+    op.execute("""
+        CREATE FUNCTION upsell_analysis_rollup_trigger() RETURNS trigger AS $$
+        DECLARE
+            d dialogues;
+        BEGIN
+            SELECT * INTO d FROM dialogues
+            WHERE dialogue_id = COALESCE(NEW.dialogue_id, OLD.dialogue_id)
+            FOR SHARE;
+            IF NOT FOUND THEN
+                RETURN NULL;
+            END IF;
+
+            -- Swap the dialogue's contribution with the old analysis (none on
+            -- INSERT) for the one with the new analysis (none on DELETE)
+            PERFORM dialogue_rollup_apply(
+                d, CASE WHEN TG_OP = 'INSERT' THEN NULL ELSE OLD END, -1
+            );
+            PERFORM dialogue_rollup_apply(
+                d, CASE WHEN TG_OP = 'DELETE' THEN NULL ELSE NEW END, 1
+            );
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogue_upsell_analysis_rollup
+        AFTER INSERT OR DELETE
+            OR UPDATE OF attempted, quality_score, categories, customer_reaction
+        ON dialogue_upsell_analysis
+        FOR EACH ROW EXECUTE FUNCTION upsell_analysis_rollup_trigger()
+    """)
+
+    # Backfill from existing data
+    op.execute("""
+        SELECT dialogue_rollup_apply(d, a, 1)
+        FROM dialogues d
+        LEFT JOIN dialogue_upsell_analysis a ON a.dialogue_id = d.dialogue_id
+        WHERE d.asr_status = 'DONE'
+    """)
+
+    op.execute(
+        "DROP TRIGGER trg_dialogue_upsell_analysis_categories ON dialogue_upsell_analysis"
+    )
+    op.execute("DROP FUNCTION sync_upsell_analysis_categories()")
+    op.drop_index(
+        "ix_dialogue_upsell_analysis_categories_category",
+        table_name="dialogue_upsell_analysis_categories",
+    )
+    op.drop_table("dialogue_upsell_analysis_categories")
+
+
+def downgrade() -> None:
+    # Restore 012's categories table, its sync trigger and its contents
+    op.create_table(
+        "dialogue_upsell_analysis_categories",
+        sa.Column("dialogue_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("category", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("dialogue_id", "category"),
+        sa.ForeignKeyConstraint(
+            ["dialogue_id"],
+            ["dialogue_upsell_analysis.dialogue_id"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_dialogue_upsell_analysis_categories_category",
+        "dialogue_upsell_analysis_categories",
+        ["category"],
+    )
+    op.execute("""
+        CREATE FUNCTION sync_upsell_analysis_categories() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM dialogue_upsell_analysis_categories
+                WHERE dialogue_id = OLD.dialogue_id;
+            END IF;
+            INSERT INTO dialogue_upsell_analysis_categories (dialogue_id, category)
+            SELECT DISTINCT NEW.dialogue_id, c
+            FROM jsonb_array_elements_text(NEW.categories) AS c;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogue_upsell_analysis_categories
+        AFTER INSERT OR UPDATE OF categories ON dialogue_upsell_analysis
+        FOR EACH ROW EXECUTE FUNCTION sync_upsell_analysis_categories()
+    """)
+    op.execute("""
+        INSERT INTO dialogue_upsell_analysis_categories (dialogue_id, category)
+        SELECT DISTINCT dua.dialogue_id, c
+        FROM dialogue_upsell_analysis dua,
+             jsonb_array_elements_text(dua.categories) AS c
+    """)
+
+    op.execute(
+        "DROP TRIGGER trg_dialogue_upsell_analysis_rollup ON dialogue_upsell_analysis"
+    )
+    op.execute("DROP TRIGGER trg_dialogues_rollup_delete ON dialogues")
+    op.execute("DROP TRIGGER trg_dialogues_rollup ON dialogues")
+    op.execute("DROP FUNCTION upsell_analysis_rollup_trigger()")
+    op.execute("DROP FUNCTION dialogues_rollup_trigger()")
+    op.execute(
+        "DROP FUNCTION dialogue_rollup_apply(dialogues, dialogue_upsell_analysis, integer)"
+    )
+    op.drop_table("dialogue_daily_category_rollup")
+    op.drop_table("dialogue_daily_rollup")
@@ -0,0 +1,160 @@
+"""Store low-cardinality status/label columns as PostgreSQL enums.
+
+analysis_status, review_status, attempted, customer_reaction and review reason
+have 3-6 values each but were TEXT (with CHECK constraints on some). Enums
+store 4 bytes per value and compare by OID, which shrinks dialogues and
+dialogue_upsell_analysis and speeds up the COUNT(*) FILTER aggregates. The
+CHECK constraints become redundant and are dropped.
+
+Changing a column type rewrites the table under an ACCESS EXCLUSIVE lock, so
+run this in a maintenance window. Triggers listing these columns in
+UPDATE OF and partial indexes whose predicates compare them to text literals
+block the type change; they are dropped and recreated around it.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ANALYSIS_STATUS = postgresql.ENUM(
+    "PENDING", "PROCESSING", "DONE", "SKIPPED", "ERROR",
+    name="analysis_status_t",
+)
+REVIEW_STATUS = postgresql.ENUM("NONE", "FLAGGED", "RESOLVED", name="review_status_t")
+REVIEW_REASON = postgresql.ENUM(
+    "bad_asr", "llm_missed_upsell", "llm_false_positive",
+    "wrong_quality", "wrong_category", "other",
+    name="review_reason_t",
+)
+ATTEMPTED = postgresql.ENUM("yes", "no", "uncertain", name="upsell_attempted_t")
+CUSTOMER_REACTION = postgresql.ENUM(
+    "accepted", "rejected", "unclear", name="customer_reaction_t"
+)
+
+# (table, column, enum, server_default)
+ENUM_COLUMNS = (
+    ("dialogues", "analysis_status", ANALYSIS_STATUS, "PENDING"),
+    ("dialogues", "review_status", REVIEW_STATUS, "NONE"),
+    ("dialogue_reviews", "reason", REVIEW_REASON, None),
+    ("dialogue_upsell_analysis", "attempted", ATTEMPTED, None),
+    ("dialogue_upsell_analysis", "customer_reaction", CUSTOMER_REACTION, None),
+    ("dialogue_upsell_analysis_history", "attempted", ATTEMPTED, None),
+    ("dialogue_upsell_analysis_history", "customer_reaction", CUSTOMER_REACTION, None),
+)
+
+CHECK_CONSTRAINTS = (
+    (
+        "ck_dialogue_upsell_analysis_attempted",
+        "dialogue_upsell_analysis",
+        "attempted IN ('yes', 'no', 'uncertain')",
+    ),
+    (
+        "ck_dialogue_upsell_analysis_customer_reaction",
+        "dialogue_upsell_analysis",
+        "customer_reaction IN ('accepted', 'rejected', 'unclear')",
+    ),
+    (
+        "ck_dialogue_reviews_reason",
+        "dialogue_reviews",
+        "reason IN ('bad_asr', 'llm_missed_upsell', 'llm_false_positive', "
+        "'wrong_quality', 'wrong_category', 'other')",
+    ),
+)
+
+
+def _drop_dependents() -> None:
+    op.execute("DROP TRIGGER trg_dialogues_rollup ON dialogues")
+    op.execute(
+        "DROP TRIGGER trg_dialogue_upsell_analysis_rollup ON dialogue_upsell_analysis"
+    )
+    op.drop_index("ix_dialogues_point_start_status", table_name="dialogues")
+    op.drop_index("ix_dialogues_analysis_stuck", table_name="dialogues")
+
+
+def _create_dependents() -> None:
+    op.create_index(
+        "ix_dialogues_point_start_status",
+        "dialogues",
+        ["point_id", "start_ts"],
+        postgresql_where=sa.text("analysis_status = 'DONE'"),
+    )
+    op.create_index(
+        "ix_dialogues_analysis_stuck",
+        "dialogues",
+        ["analysis_processing_started_at"],
+        postgresql_where=sa.text("analysis_status = 'PROCESSING'"),
+    )
+    op.execute("""
+        CREATE TRIGGER trg_dialogues_rollup
+        AFTER INSERT OR UPDATE OF start_ts, point_id, asr_status, analysis_status
+        ON dialogues
+        FOR EACH ROW EXECUTE FUNCTION dialogues_rollup_trigger()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_dialogue_upsell_analysis_rollup
+        AFTER INSERT OR DELETE
+            OR UPDATE OF attempted, quality_score, categories, customer_reaction
+        ON dialogue_upsell_analysis
+        FOR EACH ROW EXECUTE FUNCTION upsell_analysis_rollup_trigger()
+    """)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for enum in (ANALYSIS_STATUS, REVIEW_STATUS, REVIEW_REASON, ATTEMPTED, CUSTOMER_REACTION):
+        enum.create(bind)
+
+    for name, table, _ in CHECK_CONSTRAINTS:
+        op.drop_constraint(name, table, type_="check")
+
+    _drop_dependents()
+
+    for table, column, enum, default in ENUM_COLUMNS:
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=enum,
+            postgresql_using=f"{column}::{enum.name}",
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
+
+    _create_dependents()
+
+
+def downgrade() -> None:
+    _drop_dependents()
+
+    for table, column, _, default in ENUM_COLUMNS:
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            postgresql_using=f"{column}::text",
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
+
+    _create_dependents()
+
+    for name, table, condition in CHECK_CONSTRAINTS:
+        op.create_check_constraint(name, table, condition)
+
+    bind = op.get_bind()
+    for enum in (ANALYSIS_STATUS, REVIEW_STATUS, REVIEW_REASON, ATTEMPTED, CUSTOMER_REACTION):
+        enum.drop(bind)
@@ -0,0 +1,75 @@
+"""Add partial indexes for the analysis queue and reviewed dialogues.
+
+The analysis worker polls transcribed PENDING dialogues ordered by start_ts.
+ix_dialogues_start_ts_status covers every transcribed dialogue, so the poll
+walks the whole analyzed history in start_ts order before it reaches the
+queue. ix_dialogues_pending_analysis holds only the queue and returns the
+batch from its first leaf pages.
+
+ix_dialogues_review_status indexed every dialogue although almost all are
+'NONE'. The review export scans reviewed dialogues by start_ts, so the index is
+replaced with ix_dialogues_reviewed on start_ts limited to reviewed rows.
+
+Indexes are built CONCURRENTLY outside the migration transaction so ingest
+keeps writing to dialogues while they build.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_pending_analysis",
+            "dialogues",
+            ["start_ts"],
+            postgresql_where=sa.text(
+                "asr_status = 'DONE' AND analysis_status = 'PENDING'"
+            ),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_dialogues_reviewed",
+            "dialogues",
+            ["start_ts"],
+            postgresql_where=sa.text("review_status <> 'NONE'"),
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_dialogues_review_status",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_review_status",
+            "dialogues",
+            ["review_status"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_reviewed",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_pending_analysis",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,62 @@
+"""Index enabled devices by token_hash.
+
+Device authentication looks devices up by token_hash among enabled devices,
+and no index covered that column, so every Redis cache miss scanned the
+devices table. The index only holds enabled devices, and is unique because
+the lookup expects a token to resolve to at most one of them.
+
+Enabled devices sharing a token hash were not rejected before, so the upgrade
+first checks for them and fails with the offending device ids: which device
+keeps the token is for an operator to decide (disable the others, then rerun).
+The index is built CONCURRENTLY outside the migration transaction so device
+authentication keeps reading, and registration keeps writing, devices.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT array_agg(device_id::text ORDER BY created_at) AS device_ids
+        FROM devices
+        WHERE is_enabled
+        GROUP BY token_hash
+        HAVING COUNT(*) > 1
+    """)).scalars().all()
+    if duplicates:
+        groups = "; ".join(", ".join(device_ids) for device_ids in duplicates)
+        raise RuntimeError(
+            "Enabled devices share a token; disable all but one device of each "
+            f"group before upgrading: {groups}"
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_devices_token_hash_enabled",
+            "devices",
+            ["token_hash"],
+            unique=True,
+            postgresql_where=sa.text("is_enabled"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_devices_token_hash_enabled",
+            table_name="devices",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,65 @@
+"""Cover the review export's dialogue columns in the reviewed index.
+
+The review export reads reviewed dialogues in a start_ts range through
+ix_dialogues_reviewed and then fetched every matching dialogue row from the
+heap for its ids and times. ix_dialogues_reviewed_export carries those
+columns, so the outer scan of the export can run index-only; the transcript,
+analysis and review joins stay lookups by dialogue_id. It replaces
+ix_dialogues_reviewed, which it serves equally for start_ts ranges.
+
+Indexes are built CONCURRENTLY outside the migration transaction so ingest
+keeps writing to dialogues while they build.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_reviewed_export",
+            "dialogues",
+            ["start_ts"],
+            postgresql_include=[
+                "dialogue_id",
+                "point_id",
+                "register_id",
+                "end_ts",
+                "review_status",
+            ],
+            postgresql_where=sa.text("review_status <> 'NONE'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_reviewed",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_dialogues_reviewed",
+            "dialogues",
+            ["start_ts"],
+            postgresql_where=sa.text("review_status <> 'NONE'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_dialogues_reviewed_export",
+            table_name="dialogues",
+            postgresql_concurrently=True,
+        )
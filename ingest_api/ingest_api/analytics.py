@@ -1,17 +1,20 @@
 """Analytics API routes for upsell analysis dashboard."""
 
+import hashlib
 import logging
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .auth import get_current_user
-from .db import get_session
+from .cache import cache_delete, cache_get, cache_set
+from .db import get_analytics_session
+from .settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +109,241 @@ class DialogueListResponse(BaseModel):
     dialogues: list[DialogueAnalysisSummary]
 
 
+# Whole-list validator: one pydantic-core call per response instead of a
+# Python-level model constructor per row
+_DIALOGUE_SUMMARIES = TypeAdapter(list[DialogueAnalysisSummary])
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+#
+# Built once at import: optional filters are NULL-able binds, so each endpoint
+# sends one constant SQL text and asyncpg reuses its prepared statement.
+
+# Counters are maintained per (day, point_id, hour) by triggers on
+# dialogues/dialogue_upsell_analysis (migration 014), so this sums at most
+# 24 rows per point instead of aggregating the day's dialogues. The complete
+# DailyAnalyticsResponse JSON is assembled here and returned as-is.
+_DAILY_ANALYTICS_QUERY = text("""
+    WITH hourly AS (
+        SELECT
+            hour,
+            SUM(dialogues_total) as dialogues_total,
+            SUM(dialogues_analyzed) as dialogues_analyzed,
+            SUM(dialogues_skipped) as dialogues_skipped,
+            SUM(dialogues_error) as dialogues_error,
+            SUM(analyses_total) as analyses_total,
+            SUM(attempted_yes) as attempted_yes,
+            SUM(attempted_no) as attempted_no,
+            SUM(attempted_uncertain) as attempted_uncertain,
+            SUM(quality_sum) as quality_sum,
+            SUM(quality_0) as quality_0,
+            SUM(quality_1) as quality_1,
+            SUM(quality_2) as quality_2,
+            SUM(quality_3) as quality_3,
+            SUM(accepted) as accepted,
+            SUM(rejected) as rejected,
+            SUM(unclear) as unclear
+        FROM dialogue_daily_rollup
+        WHERE day = :day
+            AND (CAST(:point_id AS uuid) IS NULL OR point_id = :point_id)
+        GROUP BY hour
+    ),
+    totals AS (
+        SELECT
+            COALESCE(SUM(dialogues_total), 0) as dialogues_total,
+            COALESCE(SUM(dialogues_analyzed), 0) as dialogues_analyzed,
+            COALESCE(SUM(dialogues_skipped), 0) as dialogues_skipped,
+            COALESCE(SUM(dialogues_error), 0) as dialogues_error,
+            COALESCE(SUM(analyses_total), 0) as analyses_total,
+            COALESCE(SUM(attempted_yes), 0) as attempted_yes,
+            COALESCE(SUM(attempted_no), 0) as attempted_no,
+            COALESCE(SUM(attempted_uncertain), 0) as attempted_uncertain,
+            COALESCE(SUM(quality_sum), 0) as quality_sum,
+            COALESCE(SUM(quality_0), 0) as quality_0,
+            COALESCE(SUM(quality_1), 0) as quality_1,
+            COALESCE(SUM(quality_2), 0) as quality_2,
+            COALESCE(SUM(quality_3), 0) as quality_3,
+            COALESCE(SUM(accepted), 0) as accepted,
+            COALESCE(SUM(rejected), 0) as rejected,
+            COALESCE(SUM(unclear), 0) as unclear
+        FROM hourly
+    ),
+    categories AS (
+        SELECT category, SUM(dialogues) as count
+        FROM dialogue_daily_category_rollup
+        WHERE day = :day
+            AND (CAST(:point_id AS uuid) IS NULL OR point_id = :point_id)
+        GROUP BY category
+        HAVING SUM(dialogues) > 0
+        ORDER BY count DESC
+        LIMIT 10
+    )
+    SELECT json_build_object(
+        'date', CAST(:day AS date),
+        'point_id', CAST(:point_id AS uuid),
+        'dialogues_total', t.dialogues_total,
+        'dialogues_analyzed', t.dialogues_analyzed,
+        'dialogues_skipped', t.dialogues_skipped,
+        'dialogues_error', t.dialogues_error,
+        'attempted_yes', t.attempted_yes,
+        'attempted_no', t.attempted_no,
+        'attempted_uncertain', t.attempted_uncertain,
+        'attempted_rate',
+            COALESCE(round(t.attempted_yes::numeric / NULLIF(t.dialogues_analyzed, 0), 4), 0.0),
+        'avg_quality',
+            COALESCE(round(t.quality_sum::numeric / NULLIF(t.analyses_total, 0), 2), 0.0),
+        'quality_distribution', json_build_object(
+            '0', t.quality_0, '1', t.quality_1, '2', t.quality_2, '3', t.quality_3
+        ),
+        'accepted_count', t.accepted,
+        'rejected_count', t.rejected,
+        'unclear_count', t.unclear,
+        'accepted_rate',
+            COALESCE(round(t.accepted::numeric / NULLIF(t.accepted + t.rejected, 0), 4), 0.0),
+        'top_categories', (
+            SELECT COALESCE(json_agg(
+                json_build_object('category', c.category, 'count', c.count)
+                ORDER BY c.count DESC
+            ), '[]')
+            FROM categories c
+        ),
+        'hourly', (
+            SELECT COALESCE(json_agg(
+                json_build_object(
+                    'hour', h.hour,
+                    'dialogues_total', h.analyses_total,
+                    'attempted_yes', h.attempted_yes,
+                    'attempted_no', h.attempted_no,
+                    'attempted_uncertain', h.attempted_uncertain,
+                    'avg_quality', h.quality_sum::float8 / h.analyses_total,
+                    'accepted_count', h.accepted,
+                    'rejected_count', h.rejected
+                )
+                ORDER BY h.hour
+            ), '[]')
+            FROM hourly h
+            WHERE h.analyses_total > 0
+        )
+    )::text as payload
+    FROM totals t
+""")
+
+_DIALOGUES_WHERE = """
+    d.start_ts >= :date_start AND d.start_ts < :date_end
+    AND d.analysis_status = 'DONE'
+    AND (CAST(:point_id AS uuid) IS NULL OR d.point_id = :point_id)
+    AND (CAST(:min_quality AS integer) IS NULL OR dua.quality_score >= :min_quality)
+    AND (CAST(:attempted AS text) IS NULL OR CAST(dua.attempted AS text) = :attempted)
+"""
+
+# The page is cut before joining transcripts so at most :limit transcript
+# values are detoasted for the snippet, and the total comes from a window
+# count over the same scan. A single day is small enough for an exact count;
+# wider ranges would want an estimate.
+_DIALOGUES_PAGE_QUERY = text(f"""
+    WITH page AS (
+        SELECT
+            d.dialogue_id,
+            d.start_ts,
+            d.end_ts,
+            d.point_id,
+            d.register_id,
+            dua.quality_score,
+            dua.attempted,
+            dua.categories,
+            dua.customer_reaction,
+            dua.closing_question,
+            dua.summary,
+            COUNT(*) OVER () as total_count
+        FROM dialogues d
+        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
+        WHERE {_DIALOGUES_WHERE}
+        ORDER BY d.start_ts DESC
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT
+        page.*,
+        p.name as point_name,
+        r.name as register_name,
+        LEFT(dt.text, 200) as text_snippet
+    FROM page
+    LEFT JOIN dialogue_transcripts dt ON page.dialogue_id = dt.dialogue_id
+    LEFT JOIN points p ON page.point_id = p.point_id
+    LEFT JOIN registers r ON page.register_id = r.register_id
+    ORDER BY page.start_ts DESC
+""")
+
+_DIALOGUES_COUNT_QUERY = text(f"""
+    SELECT COUNT(*)
+    FROM dialogues d
+    JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
+    WHERE {_DIALOGUES_WHERE}
+""")
+
+# Whether a day can still change: dialogues awaiting ASR or analysis
+_DAY_UNSETTLED_QUERY = text("""
+    SELECT EXISTS (
+        SELECT 1
+        FROM dialogues d
+        WHERE d.start_ts >= :date_start AND d.start_ts < :date_end
+            AND (CAST(:point_id AS uuid) IS NULL OR d.point_id = :point_id)
+            AND (
+                d.asr_status IN ('PENDING', 'PROCESSING')
+                OR (d.asr_status = 'DONE' AND d.analysis_status IN ('PENDING', 'PROCESSING'))
+            )
+    )
+""")
+
+
+def utc_day_range(day: date) -> tuple[datetime, datetime]:
+    """Return the half-open [start, end) UTC datetime range of a day."""
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def _daily_cache_key(day: date, point_id: UUID | None) -> str:
+    return f"analytics:daily:{day.isoformat()}:{point_id or 'all'}"
+
+
+async def invalidate_daily_analytics(day: date, point_id: UUID) -> None:
+    """Drop cached daily analytics for a day, per point and across points."""
+    await cache_delete(_daily_cache_key(day, point_id), _daily_cache_key(day, None))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    If-None-Match uses weak comparison, so a W/ prefix (added e.g. by proxies
+    that re-encode the body) is ignored; "*" matches any current response.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _etag_response(request: Request, payload: str | bytes) -> Response:
+    """
+    Return a JSON payload with an ETag, or 304 if the client already has it.
+
+    The ETag is a hash of the body, so it changes whenever the content does.
+    Clients must revalidate on every use: dashboard pages poll these endpoints
+    and a review or analysis rerun has to show up at once.
+    """
+    body = payload.encode() if isinstance(payload, str) else payload
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -117,182 +355,44 @@ class DialogueListResponse(BaseModel):
     dependencies=[Depends(get_current_user)],
 )
 async def get_daily_analytics(
+    request: Request,
     date: date = Query(..., description="Date in YYYY-MM-DD format"),
     point_id: UUID | None = Query(None, description="Filter by point_id"),
-    session: AsyncSession = Depends(get_session),
-) -> DailyAnalyticsResponse:
+    session: AsyncSession = Depends(get_analytics_session),
+) -> Response:
     """
     Get daily analytics aggregates.
 
     Returns aggregated upsell metrics for the specified date,
-    optionally filtered by point_id.
+    optionally filtered by point_id. Responses are cached in Redis: briefly
+    while the day can still change, for hours once it has settled.
     """
-    # Base date filter
-    date_start = datetime.combine(date, datetime.min.time()).replace(tzinfo=timezone.utc)
-    date_end = datetime.combine(date, datetime.max.time()).replace(tzinfo=timezone.utc)
-
-    # Build point filter
-    point_filter = "AND d.point_id = :point_id" if point_id else ""
-    params: dict[str, Any] = {"date_start": date_start, "date_end": date_end}
-    if point_id:
-        params["point_id"] = point_id
-
-    # Get dialogue counts by status
-    status_query = text(f"""
-        SELECT
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE d.analysis_status = 'DONE') as analyzed,
-            COUNT(*) FILTER (WHERE d.analysis_status = 'SKIPPED') as skipped,
-            COUNT(*) FILTER (WHERE d.analysis_status = 'ERROR') as error
-        FROM dialogues d
-        WHERE d.start_ts >= :date_start AND d.start_ts < :date_end
-            AND d.asr_status = 'DONE'
-            {point_filter}
-    """)
-    result = await session.execute(status_query, params)
-    status_row = result.fetchone()
-
-    dialogues_total = status_row.total or 0
-    dialogues_analyzed = status_row.analyzed or 0
-    dialogues_skipped = status_row.skipped or 0
-    dialogues_error = status_row.error or 0
-
-    if dialogues_analyzed == 0:
-        # No data - return empty response
-        return DailyAnalyticsResponse(
-            date=date,
-            point_id=point_id,
-            dialogues_total=dialogues_total,
-            dialogues_analyzed=0,
-            dialogues_skipped=dialogues_skipped,
-            dialogues_error=dialogues_error,
-            attempted_yes=0,
-            attempted_no=0,
-            attempted_uncertain=0,
-            attempted_rate=0.0,
-            avg_quality=0.0,
-            quality_distribution={0: 0, 1: 0, 2: 0, 3: 0},
-            accepted_count=0,
-            rejected_count=0,
-            unclear_count=0,
-            accepted_rate=0.0,
-            top_categories=[],
-            hourly=[],
+    cache_key = _daily_cache_key(date, point_id)
+    payload = await cache_get(cache_key)
+    if payload is None:
+        result = await session.execute(
+            _DAILY_ANALYTICS_QUERY, {"day": date, "point_id": point_id}
         )
+        payload = result.scalar_one()
 
-    # Get upsell metrics
-    metrics_query = text(f"""
-        SELECT
-            COUNT(*) FILTER (WHERE dua.attempted = 'yes') as attempted_yes,
-            COUNT(*) FILTER (WHERE dua.attempted = 'no') as attempted_no,
-            COUNT(*) FILTER (WHERE dua.attempted = 'uncertain') as attempted_uncertain,
-            AVG(dua.quality_score) as avg_quality,
-            COUNT(*) FILTER (WHERE dua.quality_score = 0) as quality_0,
-            COUNT(*) FILTER (WHERE dua.quality_score = 1) as quality_1,
-            COUNT(*) FILTER (WHERE dua.quality_score = 2) as quality_2,
-            COUNT(*) FILTER (WHERE dua.quality_score = 3) as quality_3,
-            COUNT(*) FILTER (WHERE dua.customer_reaction = 'accepted') as accepted,
-            COUNT(*) FILTER (WHERE dua.customer_reaction = 'rejected') as rejected,
-            COUNT(*) FILTER (WHERE dua.customer_reaction = 'unclear') as unclear
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        WHERE d.start_ts >= :date_start AND d.start_ts < :date_end
-            AND d.analysis_status = 'DONE'
-            {point_filter}
-    """)
-    result = await session.execute(metrics_query, params)
-    metrics_row = result.fetchone()
-
-    attempted_yes = metrics_row.attempted_yes or 0
-    attempted_no = metrics_row.attempted_no or 0
-    attempted_uncertain = metrics_row.attempted_uncertain or 0
-    accepted_count = metrics_row.accepted or 0
-    rejected_count = metrics_row.rejected or 0
-    unclear_count = metrics_row.unclear or 0
-
-    # Calculate rates
-    attempted_rate = attempted_yes / dialogues_analyzed if dialogues_analyzed > 0 else 0.0
-    accepted_total = accepted_count + rejected_count
-    accepted_rate = accepted_count / accepted_total if accepted_total > 0 else 0.0
-
-    # Get top categories
-    categories_query = text(f"""
-        SELECT category, COUNT(*) as count
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id,
-        jsonb_array_elements_text(dua.categories) as category
-        WHERE d.start_ts >= :date_start AND d.start_ts < :date_end
-            AND d.analysis_status = 'DONE'
-            {point_filter}
-        GROUP BY category
-        ORDER BY count DESC
-        LIMIT 10
-    """)
-    result = await session.execute(categories_query, params)
-    top_categories = [
-        CategoryCount(category=row.category, count=row.count)
-        for row in result.fetchall()
-    ]
-
-    # Get hourly breakdown
-    hourly_query = text(f"""
-        SELECT
-            EXTRACT(HOUR FROM d.start_ts) as hour,
-            COUNT(*) as dialogues_total,
-            COUNT(*) FILTER (WHERE dua.attempted = 'yes') as attempted_yes,
-            COUNT(*) FILTER (WHERE dua.attempted = 'no') as attempted_no,
-            COUNT(*) FILTER (WHERE dua.attempted = 'uncertain') as attempted_uncertain,
-            AVG(dua.quality_score) as avg_quality,
-            COUNT(*) FILTER (WHERE dua.customer_reaction = 'accepted') as accepted,
-            COUNT(*) FILTER (WHERE dua.customer_reaction = 'rejected') as rejected
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        WHERE d.start_ts >= :date_start AND d.start_ts < :date_end
-            AND d.analysis_status = 'DONE'
-            {point_filter}
-        GROUP BY EXTRACT(HOUR FROM d.start_ts)
-        ORDER BY hour
-    """)
-    result = await session.execute(hourly_query, params)
-    hourly = [
-        HourlyStats(
-            hour=int(row.hour),
-            dialogues_total=row.dialogues_total,
-            attempted_yes=row.attempted_yes or 0,
-            attempted_no=row.attempted_no or 0,
-            attempted_uncertain=row.attempted_uncertain or 0,
-            avg_quality=float(row.avg_quality or 0),
-            accepted_count=row.accepted or 0,
-            rejected_count=row.rejected or 0,
+        settings = get_settings()
+        ttl_sec = settings.analytics_cache_ttl_sec
+        settled_before = datetime.now(timezone.utc).date() - timedelta(
+            days=settings.analytics_cache_settle_days
         )
-        for row in result.fetchall()
-    ]
+        if date < settled_before:
+            date_start, date_end = utc_day_range(date)
+            result = await session.execute(
+                _DAY_UNSETTLED_QUERY,
+                {"date_start": date_start, "date_end": date_end, "point_id": point_id},
+            )
+            if not result.scalar():
+                ttl_sec = settings.analytics_cache_settled_ttl_sec
+        await cache_set(cache_key, payload, ttl_sec)
 
-    return DailyAnalyticsResponse(
-        date=date,
-        point_id=point_id,
-        dialogues_total=dialogues_total,
-        dialogues_analyzed=dialogues_analyzed,
-        dialogues_skipped=dialogues_skipped,
-        dialogues_error=dialogues_error,
-        attempted_yes=attempted_yes,
-        attempted_no=attempted_no,
-        attempted_uncertain=attempted_uncertain,
-        attempted_rate=round(attempted_rate, 4),
-        avg_quality=round(float(metrics_row.avg_quality or 0), 2),
-        quality_distribution={
-            0: metrics_row.quality_0 or 0,
-            1: metrics_row.quality_1 or 0,
-            2: metrics_row.quality_2 or 0,
-            3: metrics_row.quality_3 or 0,
-        },
-        accepted_count=accepted_count,
-        rejected_count=rejected_count,
-        unclear_count=unclear_count,
-        accepted_rate=round(accepted_rate, 4),
-        top_categories=top_categories,
-        hourly=hourly,
-    )
+    # The payload is built by Postgres in the DailyAnalyticsResponse shape;
+    # return it without re-parsing or re-serializing
+    return _etag_response(request, payload)
 
 
 @router.get(
@@ -307,106 +407,51 @@ async def get_dialogues_with_analysis(
     attempted: str | None = Query(None, description="Filter by attempted: yes, no, uncertain"),
     limit: int = Query(50, ge=1, le=200, description="Max results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    session: AsyncSession = Depends(get_session),
-) -> DialogueListResponse:
+    session: AsyncSession = Depends(get_analytics_session),
+) -> Response:
     """
     Get list of dialogues with their analysis.
 
     Returns dialogue details including quality score, categories, and summary.
     Optionally includes a text snippet from the transcript.
     """
-    # Base date filter
-    date_start = datetime.combine(date, datetime.min.time()).replace(tzinfo=timezone.utc)
-    date_end = datetime.combine(date, datetime.max.time()).replace(tzinfo=timezone.utc)
+    date_start, date_end = utc_day_range(date)
 
-    # Build filters
-    filters = ["d.start_ts >= :date_start", "d.start_ts < :date_end", "d.analysis_status = 'DONE'"]
     params: dict[str, Any] = {
         "date_start": date_start,
         "date_end": date_end,
+        "point_id": point_id,
+        "min_quality": min_quality,
+        "attempted": attempted,
         "limit": limit,
         "offset": offset,
     }
 
-    if point_id:
-        filters.append("d.point_id = :point_id")
-        params["point_id"] = point_id
-
-    if min_quality is not None:
-        filters.append("dua.quality_score >= :min_quality")
-        params["min_quality"] = min_quality
-
-    if attempted:
-        filters.append("dua.attempted = :attempted")
-        params["attempted"] = attempted
-
-    where_clause = " AND ".join(filters)
-
-    # Count total
-    count_query = text(f"""
-        SELECT COUNT(*)
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        WHERE {where_clause}
-    """)
-    result = await session.execute(count_query, params)
-    total = result.scalar() or 0
-
-    # Get dialogues with analysis
-    query = text(f"""
-        SELECT
-            d.dialogue_id,
-            d.start_ts,
-            d.end_ts,
-            d.point_id,
-            p.name as point_name,
-            d.register_id,
-            r.name as register_name,
-            dua.quality_score,
-            dua.attempted,
-            dua.categories,
-            dua.customer_reaction,
-            dua.closing_question,
-            dua.summary,
-            LEFT(dt.text, 200) as text_snippet
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
-        LEFT JOIN points p ON d.point_id = p.point_id
-        LEFT JOIN registers r ON d.register_id = r.register_id
-        WHERE {where_clause}
-        ORDER BY d.start_ts DESC
-        LIMIT :limit OFFSET :offset
-    """)
-    result = await session.execute(query, params)
+    result = await session.execute(_DIALOGUES_PAGE_QUERY, params)
     rows = result.fetchall()
 
-    dialogues = [
-        DialogueAnalysisSummary(
-            dialogue_id=row.dialogue_id,
-            start_ts=row.start_ts,
-            end_ts=row.end_ts,
-            point_id=row.point_id,
-            point_name=row.point_name,
-            register_id=row.register_id,
-            register_name=row.register_name,
-            quality_score=row.quality_score,
-            attempted=row.attempted,
-            categories=row.categories if isinstance(row.categories, list) else [],
-            customer_reaction=row.customer_reaction,
-            closing_question=row.closing_question,
-            summary=row.summary,
-            text_snippet=row.text_snippet,
-        )
-        for row in rows
-    ]
+    if rows:
+        total = rows[0].total_count
+    elif offset == 0:
+        total = 0
+    else:
+        # Page past the end: the window count has no row to ride on
+        result = await session.execute(_DIALOGUES_COUNT_QUERY, params)
+        total = result.scalar() or 0
+
+    # Rows are validated straight from their attributes; extra columns such
+    # as total_count are ignored
+    dialogues = _DIALOGUE_SUMMARIES.validate_python(rows, from_attributes=True)
 
-    return DialogueListResponse(
+    response = DialogueListResponse(
         date=date,
         point_id=point_id,
         total=total,
         dialogues=dialogues,
     )
+    # Serialize in pydantic-core directly; older FastAPI releases would
+    # otherwise re-walk the model with jsonable_encoder and json.dumps it
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 # =============================================================================
@@ -428,6 +473,9 @@ class PointsResponse(BaseModel):
     points: list[PointInfo]
 
 
+_POINT_INFOS = TypeAdapter(list[PointInfo])
+
+
 class DialogueDetailResponse(BaseModel):
     """Detailed dialogue information including full transcript."""
 
@@ -456,45 +504,73 @@ class DialogueDetailResponse(BaseModel):
     text: str
 
 
+_POINTS_QUERY = text("""
+    SELECT
+        d.point_id,
+        p.name,
+        COUNT(*) as dialogue_count
+    FROM dialogues d
+    LEFT JOIN points p ON d.point_id = p.point_id
+    WHERE d.start_ts >= NOW() - INTERVAL '1 day' * :days
+    GROUP BY d.point_id, p.name
+    ORDER BY dialogue_count DESC
+""")
+
+_DIALOGUE_DETAIL_QUERY = text("""
+    SELECT
+        d.dialogue_id,
+        d.point_id,
+        p.name as point_name,
+        d.register_id,
+        r.name as register_name,
+        d.start_ts,
+        d.end_ts,
+        d.review_status,
+        dua.quality_score,
+        dua.attempted,
+        dua.categories,
+        dua.customer_reaction,
+        dua.closing_question,
+        dua.summary,
+        dua.evidence_quotes,
+        dua.confidence,
+        dt.text
+    FROM dialogues d
+    JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
+    LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
+    LEFT JOIN points p ON d.point_id = p.point_id
+    LEFT JOIN registers r ON d.register_id = r.register_id
+    WHERE d.dialogue_id = :dialogue_id
+""")
+
+
 @router.get(
     "/points",
     response_model=PointsResponse,
     dependencies=[Depends(get_current_user)],
 )
 async def get_points(
+    request: Request,
     days: int = Query(30, ge=1, le=365, description="Look back N days for points"),
-    session: AsyncSession = Depends(get_session),
-) -> PointsResponse:
+    session: AsyncSession = Depends(get_analytics_session),
+) -> Response:
     """
     Get list of sales points with dialogue counts.
 
     Returns distinct point_ids from dialogues within the last N days.
+    Responses are cached in Redis for a short TTL.
     """
-    query = text("""
-        SELECT
-            d.point_id,
-            p.name as point_name,
-            COUNT(*) as dialogue_count
-        FROM dialogues d
-        LEFT JOIN points p ON d.point_id = p.point_id
-        WHERE d.start_ts >= NOW() - INTERVAL ':days days'
-        GROUP BY d.point_id, p.name
-        ORDER BY dialogue_count DESC
-    """.replace(":days", str(days)))
+    cache_key = f"analytics:points:{days}"
+    payload = await cache_get(cache_key)
+    if payload is None:
+        result = await session.execute(_POINTS_QUERY, {"days": days})
+        rows = result.fetchall()
 
-    result = await session.execute(query)
-    rows = result.fetchall()
+        points = _POINT_INFOS.validate_python(rows, from_attributes=True)
+        payload = PointsResponse(points=points).model_dump_json()
+        await cache_set(cache_key, payload, get_settings().analytics_points_cache_ttl_sec)
 
-    points = [
-        PointInfo(
-            point_id=row.point_id,
-            name=row.point_name,
-            dialogue_count=row.dialogue_count,
-        )
-        for row in rows
-    ]
-
-    return PointsResponse(points=points)
+    return _etag_response(request, payload)
 
 
 @router.get(
@@ -503,49 +579,23 @@ async def get_points(
     dependencies=[Depends(get_current_user)],
 )
 async def get_dialogue_detail(
+    request: Request,
     dialogue_id: UUID,
-    session: AsyncSession = Depends(get_session),
-) -> DialogueDetailResponse:
+    session: AsyncSession = Depends(get_analytics_session),
+) -> Response:
     """
     Get detailed information about a specific dialogue.
 
     Includes full transcript text and analysis with evidence quotes.
     """
-    query = text("""
-        SELECT
-            d.dialogue_id,
-            d.point_id,
-            p.name as point_name,
-            d.register_id,
-            r.name as register_name,
-            d.start_ts,
-            d.end_ts,
-            d.review_status,
-            dua.quality_score,
-            dua.attempted,
-            dua.categories,
-            dua.customer_reaction,
-            dua.closing_question,
-            dua.summary,
-            dua.evidence_quotes,
-            dua.confidence,
-            dt.text
-        FROM dialogues d
-        JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
-        LEFT JOIN points p ON d.point_id = p.point_id
-        LEFT JOIN registers r ON d.register_id = r.register_id
-        WHERE d.dialogue_id = :dialogue_id
-    """)
-
-    result = await session.execute(query, {"dialogue_id": dialogue_id})
+    result = await session.execute(_DIALOGUE_DETAIL_QUERY, {"dialogue_id": dialogue_id})
     row = result.fetchone()
 
     if not row:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Dialogue not found")
 
-    return DialogueDetailResponse(
+    detail = DialogueDetailResponse(
         dialogue_id=row.dialogue_id,
         point_id=row.point_id,
         point_name=row.point_name,
@@ -564,3 +614,4 @@ async def get_dialogue_detail(
         review_status=row.review_status or "NONE",
         text=row.text or "",
     )
+    return _etag_response(request, detail.model_dump_json())
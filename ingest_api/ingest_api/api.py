@@ -1,6 +1,7 @@
 """API routes for chunk ingestion and device management."""
 
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID, uuid4
@@ -13,24 +14,35 @@ from fastapi import (
     Form,
     HTTPException,
     Request,
+    Response,
     UploadFile,
     status,
 )
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .auth import (
     authenticate_device,
+    cache_device,
     hash_token,
     get_current_user,
+    invalidate_device_cache,
+    update_device_last_seen,
     verify_internal_token,
 )
-from .db import get_session
+from .db import get_session, skip_commit_flush
 from .models import AudioChunk, Device
 from .settings import Settings, get_settings
-from .storage import get_chunk_path, save_chunk_file
+from .storage import (
+    ChunkTooLargeError,
+    EmptyChunkError,
+    delete_chunk_file,
+    get_chunk_path,
+    save_chunk_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +63,29 @@ class ChunkUploadResponse(BaseModel):
     queued: bool = True
 
 
+class ChunkMetadata(BaseModel):
+    """Metadata of one chunk in a batch upload."""
+
+    point_id: UUID
+    register_id: UUID
+    device_id: UUID
+    start_ts: datetime
+    end_ts: datetime
+    codec: str
+    sample_rate: int
+    channels: int
+
+
+_CHUNK_METADATA_LIST = TypeAdapter(list[ChunkMetadata])
+
+
+class ChunkBatchUploadResponse(BaseModel):
+    """Response for successful batch chunk upload."""
+
+    status: str = "ok"
+    chunks: list[ChunkUploadResponse]
+
+
 class DeviceCreateRequest(BaseModel):
     """Request to create a new device."""
 
@@ -73,6 +108,10 @@ class DeviceResponse(BaseModel):
     last_seen_at: datetime | None
 
 
+# Whole-list validator for device rows: one pydantic-core call per response
+_DEVICE_LIST = TypeAdapter(list[DeviceResponse])
+
+
 class DeviceUpdateRequest(BaseModel):
     """Request to update device."""
 
@@ -90,36 +129,15 @@ class ErrorResponse(BaseModel):
 # =============================================================================
 
 
-@router.post(
-    "/api/v1/chunks",
-    response_model=ChunkUploadResponse,
-    responses={
-        401: {"model": ErrorResponse, "description": "Unauthorized"},
-        413: {"model": ErrorResponse, "description": "File too large"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        500: {"model": ErrorResponse, "description": "Internal error"},
-    },
-)
-async def upload_chunk(
-    request: Request,
-    point_id: UUID = Form(...),
-    register_id: UUID = Form(...),
-    device_id: UUID = Form(...),
-    start_ts: datetime = Form(...),
-    end_ts: datetime = Form(...),
-    codec: str = Form(...),
-    sample_rate: int = Form(...),
-    channels: int = Form(...),
-    chunk_file: UploadFile = File(...),
-    device: Device = Depends(authenticate_device),
-    session: AsyncSession = Depends(get_session),
-    settings: Settings = Depends(get_settings),
-) -> ChunkUploadResponse:
-    """
-    Upload an audio chunk from a recorder device.
-
-    The device must be authenticated via Bearer token.
-    """
+def _validate_chunk_metadata(
+    device: Device,
+    device_id: UUID,
+    point_id: UUID,
+    register_id: UUID,
+    start_ts: datetime,
+    end_ts: datetime,
+) -> None:
+    """Check chunk metadata against the authenticated device."""
     # Validate device_id matches authenticated device
     if device_id != device.device_id:
         logger.warning(
@@ -157,27 +175,48 @@ async def upload_chunk(
             detail="end_ts must be after start_ts",
         )
 
-    # Read file content with size check
-    content = await chunk_file.read()
-    if len(content) > settings.max_upload_size_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File exceeds maximum size of {settings.max_upload_size_bytes} bytes",
-        )
 
-    if len(content) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Empty file",
-        )
+@router.post(
+    "/api/v1/chunks",
+    response_model=ChunkUploadResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        413: {"model": ErrorResponse, "description": "File too large"},
+        422: {"model": ErrorResponse, "description": "Validation error"},
+        500: {"model": ErrorResponse, "description": "Internal error"},
+    },
+)
+async def upload_chunk(
+    request: Request,
+    point_id: UUID = Form(...),
+    register_id: UUID = Form(...),
+    device_id: UUID = Form(...),
+    start_ts: datetime = Form(...),
+    end_ts: datetime = Form(...),
+    codec: str = Form(...),
+    sample_rate: int = Form(...),
+    channels: int = Form(...),
+    chunk_file: UploadFile = File(...),
+    device: Device = Depends(authenticate_device),
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> ChunkUploadResponse:
+    """
+    Upload an audio chunk from a recorder device.
+
+    The device must be authenticated via Bearer token.
+    """
+    _validate_chunk_metadata(device, device_id, point_id, register_id, start_ts, end_ts)
 
     # Generate chunk ID and path
     chunk_id = uuid4()
     relative_path = get_chunk_path(point_id, register_id, start_ts, chunk_id)
 
     try:
-        # Save file to storage
-        full_path, file_size = await save_chunk_file(content, relative_path)
+        # Stream the upload to storage; size limits are enforced while copying
+        full_path, file_size = await save_chunk_file(
+            chunk_file.file, relative_path, settings.max_upload_size_bytes
+        )
 
         # Calculate duration
         duration_sec = int((end_ts - start_ts).total_seconds())
@@ -199,7 +238,13 @@ async def upload_chunk(
             status="QUEUED",  # Ready for processing
         )
         session.add(chunk)
+        # last_seen_at is written only for stored chunks, in the same commit
+        last_seen_at = await update_device_last_seen(session, device)
+        if settings.upload_async_commit:
+            await skip_commit_flush(session)
         await session.commit()
+        if last_seen_at is not None:
+            await cache_device(device, last_seen_at, refresh=True)
 
         logger.info(
             "chunk_uploaded",
@@ -219,6 +264,18 @@ async def upload_chunk(
             queued=True,
         )
 
+    except ChunkTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
+
+    except EmptyChunkError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+
     except Exception as e:
         logger.error(
             "chunk_upload_failed",
@@ -234,6 +291,146 @@ async def upload_chunk(
         ) from e
 
 
+@router.post(
+    "/api/v1/chunks/batch",
+    response_model=ChunkBatchUploadResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        413: {"model": ErrorResponse, "description": "File too large"},
+        422: {"model": ErrorResponse, "description": "Validation error"},
+        500: {"model": ErrorResponse, "description": "Internal error"},
+    },
+)
+async def upload_chunk_batch(
+    metadata: str = Form(..., description="JSON array, one entry per chunk_files item"),
+    chunk_files: list[UploadFile] = File(...),
+    device: Device = Depends(authenticate_device),
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> ChunkBatchUploadResponse:
+    """
+    Upload several audio chunks from a recorder device at once.
+
+    For devices catching up on a backlog: every chunk is inserted in one
+    transaction instead of one commit per chunk. The batch is all or nothing;
+    if any chunk fails, the files already stored for it are removed.
+    """
+    try:
+        items = _CHUNK_METADATA_LIST.validate_json(metadata)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="metadata must be a JSON array of chunk metadata",
+        ) from e
+
+    if len(items) != len(chunk_files):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="metadata and chunk_files must have the same length",
+        )
+    if len(items) > settings.max_upload_batch_chunks:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds maximum of {settings.max_upload_batch_chunks} chunks",
+        )
+
+    for item in items:
+        _validate_chunk_metadata(
+            device, item.device_id, item.point_id, item.register_id,
+            item.start_ts, item.end_ts,
+        )
+
+    stored_files: list[str] = []
+    try:
+        try:
+            chunks = []
+            for item, chunk_file in zip(items, chunk_files):
+                chunk_id = uuid4()
+                relative_path = get_chunk_path(
+                    item.point_id, item.register_id, item.start_ts, chunk_id
+                )
+                full_path, file_size = await save_chunk_file(
+                    chunk_file.file, relative_path, settings.max_upload_size_bytes
+                )
+                stored_files.append(full_path)
+
+                chunks.append(
+                    AudioChunk(
+                        chunk_id=chunk_id,
+                        device_id=item.device_id,
+                        point_id=item.point_id,
+                        register_id=item.register_id,
+                        start_ts=item.start_ts,
+                        end_ts=item.end_ts,
+                        duration_sec=int((item.end_ts - item.start_ts).total_seconds()),
+                        codec=item.codec,
+                        sample_rate=item.sample_rate,
+                        channels=item.channels,
+                        file_path=relative_path,
+                        file_size_bytes=file_size,
+                        status="QUEUED",
+                    )
+                )
+
+            # The unit of work sends all rows as one multi-row INSERT
+            session.add_all(chunks)
+            last_seen_at = await update_device_last_seen(session, device)
+            if settings.upload_async_commit:
+                await skip_commit_flush(session)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            for full_path in stored_files:
+                await delete_chunk_file(full_path)
+            raise
+
+    except ChunkTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        ) from e
+
+    except EmptyChunkError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+
+    except Exception as e:
+        logger.error(
+            "chunk_batch_upload_failed",
+            extra={
+                "device_id": str(device.device_id),
+                "chunks": len(items),
+                "error": str(e),
+            },
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save chunks",
+        ) from e
+
+    if last_seen_at is not None:
+        await cache_device(device, last_seen_at, refresh=True)
+
+    logger.info(
+        "chunk_batch_uploaded",
+        extra={
+            "device_id": str(device.device_id),
+            "point_id": str(device.point_id),
+            "chunks": len(chunks),
+            "file_size": sum(chunk.file_size_bytes for chunk in chunks),
+        },
+    )
+
+    return ChunkBatchUploadResponse(
+        chunks=[
+            ChunkUploadResponse(chunk_id=chunk.chunk_id, stored_path=chunk.file_path)
+            for chunk in chunks
+        ],
+    )
+
+
 # =============================================================================
 # Admin Endpoints
 # =============================================================================
@@ -268,8 +465,15 @@ async def create_device(
         is_enabled=True,
     )
     session.add(device)
-    await session.commit()
-    await session.refresh(device)
+    try:
+        await session.commit()
+    except IntegrityError:
+        # Lost a race on device_id, or another enabled device has this token
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Device already exists",
+        )
 
     logger.info(
         "device_created",
@@ -289,6 +493,23 @@ async def create_device(
     )
 
 
+_DEVICES_QUERY = text("""
+    SELECT
+        d.device_id,
+        d.point_id,
+        p.name as point_name,
+        d.register_id,
+        r.name as register_name,
+        d.is_enabled,
+        d.created_at,
+        d.last_seen_at
+    FROM devices d
+    LEFT JOIN points p ON d.point_id = p.point_id
+    LEFT JOIN registers r ON d.register_id = r.register_id
+    ORDER BY d.created_at DESC
+""")
+
+
 @router.get(
     "/api/v1/admin/devices",
     response_model=list[DeviceResponse],
@@ -296,39 +517,13 @@ async def create_device(
 )
 async def list_devices(
     session: AsyncSession = Depends(get_session),
-) -> list[DeviceResponse]:
+) -> Response:
     """List all registered devices."""
-    query = text("""
-        SELECT
-            d.device_id,
-            d.point_id,
-            p.name as point_name,
-            d.register_id,
-            r.name as register_name,
-            d.is_enabled,
-            d.created_at,
-            d.last_seen_at
-        FROM devices d
-        LEFT JOIN points p ON d.point_id = p.point_id
-        LEFT JOIN registers r ON d.register_id = r.register_id
-        ORDER BY d.created_at DESC
-    """)
-    result = await session.execute(query)
+    result = await session.execute(_DEVICES_QUERY)
     rows = result.fetchall()
 
-    return [
-        DeviceResponse(
-            device_id=row.device_id,
-            point_id=row.point_id,
-            point_name=row.point_name,
-            register_id=row.register_id,
-            register_name=row.register_name,
-            is_enabled=row.is_enabled,
-            created_at=row.created_at,
-            last_seen_at=row.last_seen_at,
-        )
-        for row in rows
-    ]
+    devices = _DEVICE_LIST.validate_python(rows, from_attributes=True)
+    return Response(content=_DEVICE_LIST.dump_json(devices), media_type="application/json")
 
 
 @router.patch(
@@ -356,8 +551,16 @@ async def update_device(
     if req.is_enabled is not None:
         device.is_enabled = req.is_enabled
 
-    await session.commit()
-    await session.refresh(device)
+    try:
+        await session.commit()
+    except IntegrityError:
+        # Re-enabling a device whose token another enabled device now uses
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Device token already in use",
+        )
+    await invalidate_device_cache(device.token_hash)
 
     logger.info(
         "device_updated",
@@ -382,27 +585,65 @@ async def update_device(
 # =============================================================================
 
 
+class DbPoolStats(BaseModel):
+    """Database connection pool usage."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
     status: str
     db: bool
+    db_pool: DbPoolStats | None = None
     storage_writable: bool
     time: datetime
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """Check service health."""
+# Last dependency check as (monotonic time, db_ok, storage_ok)
+_last_health_check: tuple[float, bool, bool] | None = None
+
+
+async def _check_dependencies() -> tuple[bool, bool]:
+    """
+    Check the database and storage, reusing a result newer than the TTL.
+
+    Probes poll /health several times per second; each check costs a DB
+    round trip and a file write.
+    """
     from .db import check_db_connection
     from .storage import check_storage_writable
 
+    global _last_health_check
+    now = time.monotonic()
+    if (
+        _last_health_check is not None
+        and now - _last_health_check[0] < get_settings().health_cache_ttl_sec
+    ):
+        return _last_health_check[1], _last_health_check[2]
+
     db_ok = await check_db_connection()
     storage_ok = await check_storage_writable()
+    _last_health_check = (now, db_ok, storage_ok)
+    return db_ok, storage_ok
+
+
+@router.get("/health", response_model=HealthResponse)
+async def health_check() -> HealthResponse:
+    """Check service health."""
+    from .db import get_pool_stats
+
+    db_ok, storage_ok = await _check_dependencies()
+    pool_stats = get_pool_stats()
 
     return HealthResponse(
         status="ok" if (db_ok and storage_ok) else "degraded",
         db=db_ok,
+        db_pool=DbPoolStats(**pool_stats) if pool_stats else None,
         storage_writable=storage_ok,
         time=datetime.now(timezone.utc),
     )
@@ -505,6 +746,14 @@ class UpdateRegisterRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
 
 
+_UPDATE_POINT_QUERY = text("""
+    UPDATE points
+    SET name = :name
+    WHERE point_id = :point_id
+    RETURNING point_id, name
+""")
+
+
 @router.patch(
     "/api/v1/admin/points/{point_id}",
     dependencies=[Depends(get_current_user)],
@@ -515,14 +764,8 @@ async def update_point(
     session: AsyncSession = Depends(get_session),
 ):
     """Update point name."""
-    query = text("""
-        UPDATE points
-        SET name = :name
-        WHERE point_id = :point_id
-        RETURNING point_id, name
-    """)
     result = await session.execute(
-        query, {"point_id": point_id, "name": req.name}
+        _UPDATE_POINT_QUERY, {"point_id": point_id, "name": req.name}
     )
     await session.commit()
 
@@ -536,6 +779,14 @@ async def update_point(
     return {"point_id": str(row.point_id), "name": row.name}
 
 
+_UPDATE_REGISTER_QUERY = text("""
+    UPDATE registers
+    SET name = :name
+    WHERE register_id = :register_id
+    RETURNING register_id, name
+""")
+
+
 @router.patch(
     "/api/v1/admin/registers/{register_id}",
     dependencies=[Depends(get_current_user)],
@@ -546,14 +797,8 @@ async def update_register(
     session: AsyncSession = Depends(get_session),
 ):
     """Update register name."""
-    query = text("""
-        UPDATE registers
-        SET name = :name
-        WHERE register_id = :register_id
-        RETURNING register_id, name
-    """)
     result = await session.execute(
-        query, {"register_id": register_id, "name": req.name}
+        _UPDATE_REGISTER_QUERY, {"register_id": register_id, "name": req.name}
     )
     await session.commit()
 
@@ -1,6 +1,8 @@
 """Authentication and authorization."""
 
+import asyncio
 import hashlib
+import json
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
@@ -13,6 +15,7 @@ from passlib.context import CryptContext
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .cache import cache_delete, cache_exists, cache_get, cache_set
 from .db import get_session
 from .models import Device, User
 from .settings import Settings, get_settings
@@ -36,32 +39,142 @@ def generate_token() -> str:
     return secrets.token_urlsafe(32)
 
 
+def _device_cache_key(token_hash: str) -> str:
+    # Keyed by the hash so a Redis dump does not expose device tokens
+    return f"device:token:{token_hash}"
+
+
+def _device_revoked_key(token_hash: str) -> str:
+    return f"device:revoked:{token_hash}"
+
+
+# How long a device change keeps its token from being cached again; longer
+# than any request that may have loaded the device before the change
+_DEVICE_REVOKED_TTL_SEC = 60
+
+
+async def cache_device(
+    device: Device,
+    last_seen_at: datetime | None,
+    refresh: bool = False,
+) -> None:
+    """
+    Cache an enabled device's identity under its token hash.
+
+    The device may have been disabled since it was loaded, and the stale
+    snapshot must not be cached again. With refresh, only an entry that is
+    still cached is rewritten; otherwise an existing entry is kept. Either
+    way the entry is dropped if the token was marked revoked meanwhile.
+    """
+    cache_key = _device_cache_key(device.token_hash)
+    payload = json.dumps({
+        "device_id": str(device.device_id),
+        "point_id": str(device.point_id),
+        "register_id": str(device.register_id),
+        "created_at": device.created_at.isoformat() if device.created_at else None,
+        "last_seen_at": last_seen_at.isoformat() if last_seen_at else None,
+    })
+    await cache_set(
+        cache_key,
+        payload,
+        get_settings().device_cache_ttl_sec,
+        only_if_exists=refresh,
+        only_if_missing=not refresh,
+    )
+    # invalidate_device_cache marks the token before dropping the entry, so
+    # checking after the write catches a change committed at any point since
+    # the device was loaded
+    if await cache_exists(_device_revoked_key(device.token_hash)):
+        await cache_delete(cache_key)
+
+
+def _device_from_cache(token_hash: str, cached: bytes) -> Device:
+    """Build a detached Device from a cached entry."""
+    data = json.loads(cached)
+    return Device(
+        device_id=UUID(data["device_id"]),
+        point_id=UUID(data["point_id"]),
+        register_id=UUID(data["register_id"]),
+        token_hash=token_hash,
+        is_enabled=True,
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        last_seen_at=(
+            datetime.fromisoformat(data["last_seen_at"]) if data["last_seen_at"] else None
+        ),
+    )
+
+
+async def invalidate_device_cache(token_hash: str) -> None:
+    """
+    Drop the cached device for a token hash after the device changes.
+
+    The token is first marked revoked for a while, so a request that loaded
+    the device before the change cannot cache it again.
+    """
+    await cache_set(_device_revoked_key(token_hash), b"1", _DEVICE_REVOKED_TTL_SEC)
+    await cache_delete(_device_cache_key(token_hash))
+
+
 async def get_device_by_token(
     session: AsyncSession,
     token: str,
 ) -> Device | None:
-    """Find device by bearer token."""
+    """
+    Find device by bearer token.
+
+    Enabled devices are cached in Redis, so chunk uploads authenticate without
+    a database round trip. A cache hit returns a Device that is not attached to
+    the session.
+    """
     token_hash = hash_token(token)
+    cached = await cache_get(_device_cache_key(token_hash))
+    if cached is not None:
+        return _device_from_cache(token_hash, cached)
+
     result = await session.execute(
         select(Device).where(
             Device.token_hash == token_hash,
             Device.is_enabled == True,  # noqa: E712
         )
     )
-    return result.scalar_one_or_none()
+    device = result.scalar_one_or_none()
+    if device is not None:
+        await cache_device(device, device.last_seen_at)
+    return device
+
+
+def _last_seen_stale(device: Device, interval_sec: int) -> bool:
+    """Check whether the device's last_seen_at is older than interval_sec."""
+    if device.last_seen_at is None:
+        return True
+    last_seen = device.last_seen_at
+    if last_seen.tzinfo is None:
+        # SQLite returns naive datetimes; stored values are UTC
+        last_seen = last_seen.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - last_seen >= timedelta(seconds=interval_sec)
 
 
 async def update_device_last_seen(
     session: AsyncSession,
-    device_id: UUID,
-) -> None:
-    """Update device last_seen_at timestamp."""
+    device: Device,
+) -> datetime | None:
+    """
+    Stage a device last_seen_at update in the caller's transaction.
+
+    last_seen_at only drives the dashboard's online status, so it is refreshed
+    at most once per interval. Nothing is committed here; returns the new
+    timestamp, or None if the stored one is still recent.
+    """
+    if not _last_seen_stale(device, get_settings().device_last_seen_interval_sec):
+        return None
+
+    last_seen_at = datetime.now(timezone.utc)
     await session.execute(
         update(Device)
-        .where(Device.device_id == device_id)
-        .values(last_seen_at=datetime.now(timezone.utc))
+        .where(Device.device_id == device.device_id)
+        .values(last_seen_at=last_seen_at)
     )
-    await session.commit()
+    return last_seen_at
 
 
 async def authenticate_device(
@@ -107,13 +220,12 @@ async def authenticate_device(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last seen asynchronously (don't block response)
-    await update_device_last_seen(session, device.device_id)
-
-    logger.debug(
-        "auth_success",
-        extra={"device_id": str(device.device_id), "point_id": str(device.point_id)},
-    )
+    # Runs per chunk upload; skip the UUID formatting unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "auth_success",
+            extra={"device_id": str(device.device_id), "point_id": str(device.point_id)},
+        )
     return device
 
 
@@ -275,11 +387,52 @@ async def authenticate_user(
         return None
     if not user.is_active:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await asyncio.to_thread(verify_password, password, user.password_hash):
         return None
     return user
 
 
+def _user_cache_key(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+async def _cache_user(user: User) -> None:
+    """Cache an active user's profile; the password hash is left out."""
+    payload = json.dumps({
+        "username": user.username,
+        "full_name": user.full_name,
+        "is_admin": user.is_admin,
+        "created_at": user.created_at.isoformat(),
+        "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None,
+    })
+    await cache_set(
+        _user_cache_key(user.user_id),
+        payload,
+        get_settings().user_cache_ttl_sec,
+    )
+
+
+def _user_from_cache(user_id: UUID, cached: bytes) -> User:
+    """Build a detached User from a cached entry."""
+    data = json.loads(cached)
+    return User(
+        user_id=user_id,
+        username=data["username"],
+        full_name=data["full_name"],
+        is_admin=data["is_admin"],
+        is_active=True,
+        created_at=datetime.fromisoformat(data["created_at"]),
+        last_login_at=(
+            datetime.fromisoformat(data["last_login_at"]) if data["last_login_at"] else None
+        ),
+    )
+
+
+async def invalidate_user_cache(user_id: UUID) -> None:
+    """Drop the cached user after the account changes."""
+    await cache_delete(_user_cache_key(user_id))
+
+
 async def update_user_last_login(
     session: AsyncSession,
     user_id: UUID,
@@ -291,6 +444,7 @@ async def update_user_last_login(
         .values(last_login_at=datetime.now(timezone.utc))
     )
     await session.commit()
+    await invalidate_user_cache(user_id)
 
 
 async def get_current_user(
@@ -301,6 +455,9 @@ async def get_current_user(
     """
     Dependency to get current authenticated user from JWT token.
 
+    A cache hit returns a User that is not attached to the session and has no
+    password hash loaded.
+
     Raises HTTPException 401 if authentication fails.
     """
     token = credentials.credentials
@@ -333,6 +490,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Dashboard pages call several endpoints per view, so active users are
+    # cached in Redis rather than selected on every request
+    cached = await cache_get(_user_cache_key(user_id))
+    if cached is not None:
+        user = _user_from_cache(user_id, cached)
+        logger.debug("user_auth_success", extra={"user_id": user_id_str})
+        return user
+
     result = await session.execute(select(User).where(User.user_id == user_id))
     user = result.scalar_one_or_none()
 
@@ -344,7 +509,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    logger.debug("user_auth_success", extra={"user_id": str(user.user_id)})
+    await _cache_user(user)
+
+    logger.debug("user_auth_success", extra={"user_id": user_id_str})
     return user
 
 
@@ -0,0 +1,84 @@
+"""Redis-backed response cache.
+
+The cache is an optimization only: every operation swallows Redis errors and
+behaves like a miss, so the API keeps serving from the database when Redis is
+unavailable.
+"""
+
+import logging
+
+from redis.asyncio import Redis
+
+from .settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        settings = get_settings()
+        _redis = Redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _redis
+
+
+async def cache_get(key: str) -> bytes | None:
+    """Return the cached value, or None on miss or Redis error."""
+    try:
+        return await get_redis().get(key)
+    except Exception as e:
+        logger.warning("cache_get_failed", extra={"key": key, "error": str(e)})
+        return None
+
+
+async def cache_set(
+    key: str,
+    value: str | bytes,
+    ttl_sec: int,
+    only_if_exists: bool = False,
+    only_if_missing: bool = False,
+) -> None:
+    """Store a value with a TTL, ignoring Redis errors.
+
+    With only_if_exists the value is only written over an existing entry
+    (SET XX), so a refresh cannot recreate an entry deleted meanwhile. With
+    only_if_missing an existing entry is kept (SET NX).
+    """
+    try:
+        await get_redis().set(
+            key, value, ex=ttl_sec, xx=only_if_exists, nx=only_if_missing
+        )
+    except Exception as e:
+        logger.warning("cache_set_failed", extra={"key": key, "error": str(e)})
+
+
+async def cache_exists(key: str) -> bool:
+    """Check whether a key is cached; False on Redis error."""
+    try:
+        return bool(await get_redis().exists(key))
+    except Exception as e:
+        logger.warning("cache_exists_failed", extra={"key": key, "error": str(e)})
+        return False
+
+
+async def cache_delete(*keys: str) -> None:
+    """Delete keys, ignoring Redis errors."""
+    try:
+        await get_redis().delete(*keys)
+    except Exception as e:
+        logger.warning("cache_delete_failed", extra={"keys": keys, "error": str(e)})
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
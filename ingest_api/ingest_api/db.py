@@ -3,13 +3,18 @@
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from uuid import uuid4
 
+from fastapi import Depends
+from sqlalchemy import Connection, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.pool import QueuePool
 
 from .settings import get_settings
 
@@ -17,6 +22,46 @@ logger = logging.getLogger(__name__)
 
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_export_engine: AsyncEngine | None = None
+
+
+def _create_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """Create an engine with the configured pool behaviour and given size."""
+    settings = get_settings()
+    pool_pre_ping = settings.db_pool_pre_ping
+    pool_recycle = settings.db_pool_recycle_sec
+    connect_args = {}
+    pgbouncer = settings.pgbouncer_mode or "pgbouncer" in settings.database_url
+    if pgbouncer:
+        pool_pre_ping = False
+        pool_recycle = settings.pgbouncer_pool_recycle_sec
+        # In transaction pooling consecutive transactions may run on different
+        # server connections, so prepared statements must not be cached and
+        # their names must not collide with ones another client left behind
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    engine = create_async_engine(
+        settings.database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout_sec,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
+        echo=False,
+    )
+    logger.info(
+        "database_engine_created",
+        extra={
+            "url": settings.database_url.split("@")[-1],
+            "pgbouncer": pgbouncer,
+            "pool_size": pool_size,
+        },
+    )
+    return engine
 
 
 def get_engine() -> AsyncEngine:
@@ -24,17 +69,26 @@ def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(
-            settings.database_url,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            echo=False,
-        )
-        logger.info("database_engine_created", extra={"url": settings.database_url.split("@")[-1]})
+        _engine = _create_engine(settings.db_pool_size, settings.db_max_overflow)
     return _engine
 
 
+def get_export_engine() -> AsyncEngine:
+    """
+    Get or create the engine for streaming exports.
+
+    An export holds its connection for as long as the client downloads, so
+    exports get their own small pool and cannot starve the request pool.
+    """
+    global _export_engine
+    if _export_engine is None:
+        settings = get_settings()
+        _export_engine = _create_engine(
+            settings.db_export_pool_size, settings.db_export_max_overflow
+        )
+    return _export_engine
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -52,10 +106,59 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that yields a database session."""
     factory = get_session_factory()
     async with factory() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+_ANALYTICS_SETTINGS_QUERY = text("""
+    SELECT
+        set_config('jit', 'off', true),
+        set_config('statement_timeout', :timeout, true)
+""")
+
+
+def _apply_analytics_settings(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Set transaction-local limits for analytics queries (PostgreSQL only)."""
+    if connection.dialect.name != "postgresql":
+        return
+    settings = get_settings()
+    connection.execute(
+        _ANALYTICS_SETTINGS_QUERY,
+        {"timeout": f"{settings.analytics_statement_timeout_ms}ms"},
+    )
+
+
+async def get_analytics_session(
+    session: AsyncSession = Depends(get_session),
+) -> AsyncSession:
+    """
+    Dependency that yields a database session for dashboard analytics.
+
+    Every transaction on the session runs with JIT off, since compiling costs
+    more than these short queries take, and with a statement timeout so a
+    runaway query cannot hold a connection. Both are transaction-local, so the
+    pooled connection is unaffected afterwards.
+    """
+    event.listen(session.sync_session, "after_begin", _apply_analytics_settings)
+    return session
+
+
+_SYNC_COMMIT_OFF_QUERY = text("SELECT set_config('synchronous_commit', 'off', true)")
+
+
+async def skip_commit_flush(session: AsyncSession) -> None:
+    """
+    Let the session's current transaction commit without waiting for WAL flush.
+
+    A database crash can lose such a commit if it was made within the last
+    few hundred milliseconds, but it cannot corrupt data. The setting is
+    transaction-local and PostgreSQL only.
+    """
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    await connection.execute(_SYNC_COMMIT_OFF_QUERY)
 
 
 @asynccontextmanager
@@ -63,10 +166,30 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
     """Context manager for database session (non-dependency use)."""
     factory = get_session_factory()
     async with factory() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+@asynccontextmanager
+async def get_export_session_context() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for a session on the export engine."""
+    async with AsyncSession(bind=get_export_engine(), expire_on_commit=False) as session:
+        yield session
+
+
+def get_pool_stats() -> dict[str, int] | None:
+    """Return connection pool usage, or None before the engine exists."""
+    if _engine is None or not isinstance(_engine.pool, QueuePool):
+        return None
+    pool = _engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": get_settings().db_max_overflow,
+    }
+
+
+_PING_QUERY = text("SELECT 1")
 
 
 async def check_db_connection() -> bool:
@@ -74,7 +197,7 @@ async def check_db_connection() -> bool:
     try:
         engine = get_engine()
         async with engine.connect() as conn:
-            await conn.execute(__import__("sqlalchemy").text("SELECT 1"))
+            await conn.execute(_PING_QUERY)
         return True
     except Exception as e:
         logger.error("database_check_failed", extra={"error": str(e)})
@@ -83,7 +206,10 @@ async def check_db_connection() -> bool:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _export_engine
+    if _export_engine is not None:
+        await _export_engine.dispose()
+        _export_engine = None
     if _engine is not None:
         await _engine.dispose()
         _engine = None
@@ -7,12 +7,39 @@ from datetime import datetime, timezone
 from typing import Any
 
 
+# Standard LogRecord attributes; everything else on a record came from extra
+_RECORD_ATTRS = frozenset({
+    "name",
+    "msg",
+    "args",
+    "created",
+    "filename",
+    "funcName",
+    "levelname",
+    "levelno",
+    "lineno",
+    "module",
+    "msecs",
+    "pathname",
+    "process",
+    "processName",
+    "relativeCreated",
+    "stack_info",
+    "exc_info",
+    "exc_text",
+    "thread",
+    "threadName",
+    "taskName",
+    "message",
+})
+
+
 class JSONFormatter(logging.Formatter):
     """Format log records as single-line JSON."""
 
     def format(self, record: logging.LogRecord) -> str:
         log_data: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
@@ -20,30 +47,7 @@ class JSONFormatter(logging.Formatter):
 
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "thread",
-                "threadName",
-                "taskName",
-                "message",
-            ):
+            if key not in _RECORD_ATTRS:
                 log_data[key] = value
 
         if record.exc_info:
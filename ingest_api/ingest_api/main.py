@@ -14,6 +14,7 @@ from .api import router
 from .analytics import router as analytics_router
 from .reviews import router as reviews_router
 from .users import router as users_router
+from .cache import close_redis
 from .db import close_db, get_engine
 from .logging_setup import setup_logging
 from .settings import get_settings
@@ -42,6 +43,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Cleanup
+    await close_redis()
     await close_db()
     logger.info("service_stopped")
 
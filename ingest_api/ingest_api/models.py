@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -35,6 +36,18 @@ class GUID(TypeDecorator):
         else:
             return dialect.type_descriptor(CHAR(36))
 
+    # PostgreSQL drivers bind and return uuid.UUID themselves, so the
+    # decorator's per-value conversion is only installed for CHAR(36)
+    def bind_processor(self, dialect: Dialect):
+        if dialect.name == "postgresql":
+            return self.impl_instance.bind_processor(dialect)
+        return super().bind_processor(dialect)
+
+    def result_processor(self, dialect: Dialect, coltype):
+        if dialect.name == "postgresql":
+            return self.impl_instance.result_processor(dialect, coltype)
+        return super().result_processor(dialect, coltype)
+
     def process_bind_param(self, value, dialect: Dialect):
         if value is None:
             return value
@@ -79,6 +92,10 @@ class User(Base):
 
     __table_args__ = (Index("ix_users_username", "username"),)
 
+    # Fetch created_at with RETURNING on insert, so a new user can be returned
+    # without reloading it
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<User {self.username} admin={self.is_admin}>"
 
@@ -100,11 +117,25 @@ class Device(Base):
         DateTime(timezone=True), nullable=True
     )
 
-    # Relationship to audio chunks
+    # Relationship to audio chunks. Not loaded implicitly: a device has its
+    # whole upload history here, and it is fetched on every authentication
     chunks: Mapped[list["AudioChunk"]] = relationship(
-        "AudioChunk", back_populates="device", lazy="selectin"
+        "AudioChunk", back_populates="device", lazy="raise"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_devices_token_hash_enabled",
+            "token_hash",
+            unique=True,
+            postgresql_where=text("is_enabled"),
+            sqlite_where=text("is_enabled"),
+        ),
+    )
+
+    # Fetch created_at with RETURNING on insert, as for users
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Device {self.device_id} point={self.point_id}>"
 
@@ -137,8 +168,12 @@ class AudioChunk(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # Relationship to device
-    device: Mapped["Device"] = relationship("Device", back_populates="chunks")
+    # Relationship to device. Not loaded implicitly either, so a chunk list
+    # cannot issue one device SELECT per row; load it with selectinload() or
+    # joinedload() where it is needed
+    device: Mapped["Device"] = relationship(
+        "Device", back_populates="chunks", lazy="raise"
+    )
 
     __table_args__ = (
         Index("ix_audio_chunks_point_start", "point_id", "start_ts"),
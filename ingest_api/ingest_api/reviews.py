@@ -4,19 +4,22 @@ import csv
 import io
 import json
 import logging
+import zlib
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .analytics import invalidate_daily_analytics, utc_day_range
 from .auth import get_current_user
-from .db import get_session
+from .db import get_export_session_context, get_session
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +127,20 @@ class ExportFormat(str, Enum):
 # =============================================================================
 
 
+_FLAG_DIALOGUE_QUERY = text("""
+    UPDATE dialogues
+    SET review_status = 'FLAGGED'
+    WHERE dialogue_id = :dialogue_id
+    RETURNING dialogue_id
+""")
+
+_INSERT_REVIEW_QUERY = text("""
+    INSERT INTO dialogue_reviews (dialogue_id, reviewer, flag, reason, notes, corrected)
+    VALUES (:dialogue_id, :reviewer, true, :reason, :notes, :corrected)
+    RETURNING review_id, dialogue_id, created_at, reviewer, flag, reason, notes, corrected
+""")
+
+
 @router.post(
     "/reviews/{dialogue_id}",
     response_model=ReviewResponse,
@@ -139,31 +156,16 @@ async def create_review(
 
     Marks the dialogue as FLAGGED and creates a review record.
     """
-    # Check dialogue exists
-    check_query = text("SELECT dialogue_id FROM dialogues WHERE dialogue_id = :dialogue_id")
-    result = await session.execute(check_query, {"dialogue_id": dialogue_id})
+    # Update dialogue review_status; no row back means the dialogue does not exist
+    result = await session.execute(_FLAG_DIALOGUE_QUERY, {"dialogue_id": dialogue_id})
     if not result.fetchone():
         raise HTTPException(status_code=404, detail="Dialogue not found")
 
-    # Update dialogue review_status
-    update_query = text("""
-        UPDATE dialogues
-        SET review_status = 'FLAGGED'
-        WHERE dialogue_id = :dialogue_id
-    """)
-    await session.execute(update_query, {"dialogue_id": dialogue_id})
-
     # Insert review record
     corrected_json = request.corrected.model_dump(exclude_none=True) if request.corrected else None
 
-    insert_query = text("""
-        INSERT INTO dialogue_reviews (dialogue_id, reviewer, flag, reason, notes, corrected)
-        VALUES (:dialogue_id, :reviewer, true, :reason, :notes, :corrected)
-        RETURNING review_id, dialogue_id, created_at, reviewer, flag, reason, notes, corrected
-    """)
-
     result = await session.execute(
-        insert_query,
+        _INSERT_REVIEW_QUERY,
         {
             "dialogue_id": dialogue_id,
             "reviewer": request.reviewer,
@@ -187,59 +189,20 @@ async def create_review(
     )
 
 
-@router.get(
-    "/reviews",
-    response_model=ReviewListResponse,
-    dependencies=[Depends(get_current_user)],
-)
-async def list_reviews(
-    date_from: date | None = Query(None, alias="date", description="Filter by date"),
-    point_id: UUID | None = Query(None, description="Filter by point_id"),
-    status: ReviewStatus | None = Query(None, description="Filter by review status"),
-    reason: ReviewReason | None = Query(None, description="Filter by reason"),
-    limit: int = Query(50, ge=1, le=200, description="Max results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
-    session: AsyncSession = Depends(get_session),
-) -> ReviewListResponse:
-    """
-    List reviews with optional filters.
-    """
-    filters = ["1=1"]
-    params: dict[str, Any] = {"limit": limit, "offset": offset}
-
-    if date_from:
-        date_start = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=timezone.utc)
-        date_end = datetime.combine(date_from, datetime.max.time()).replace(tzinfo=timezone.utc)
-        filters.append("d.start_ts >= :date_start AND d.start_ts < :date_end")
-        params["date_start"] = date_start
-        params["date_end"] = date_end
-
-    if point_id:
-        filters.append("d.point_id = :point_id")
-        params["point_id"] = point_id
-
-    if status:
-        filters.append("d.review_status = :status")
-        params["status"] = status.value
-
-    if reason:
-        filters.append("dr.reason = :reason")
-        params["reason"] = reason.value
-
-    where_clause = " AND ".join(filters)
-
-    # Count total
-    count_query = text(f"""
-        SELECT COUNT(*)
-        FROM dialogue_reviews dr
-        JOIN dialogues d ON dr.dialogue_id = d.dialogue_id
-        WHERE {where_clause}
-    """)
-    result = await session.execute(count_query, params)
-    total = result.scalar() or 0
-
-    # Get reviews with dialogue info
-    query = text(f"""
+# Optional filters are NULL-guarded so the SQL text is constant; every
+# parameter is always passed
+_REVIEWS_WHERE = """
+    (CAST(:date_start AS timestamptz) IS NULL
+        OR (d.start_ts >= :date_start AND d.start_ts < :date_end))
+    AND (CAST(:point_id AS uuid) IS NULL OR d.point_id = :point_id)
+    AND (CAST(:status AS text) IS NULL OR CAST(d.review_status AS text) = :status)
+    AND (CAST(:reason AS text) IS NULL OR CAST(dr.reason AS text) = :reason)
+"""
+
+# Page the reviews first and count them with a window over the same scan;
+# analysis and transcript snippets are joined for the page rows only
+_REVIEWS_PAGE_QUERY = text(f"""
+    WITH page AS (
         SELECT
             dr.review_id,
             dr.dialogue_id,
@@ -253,23 +216,74 @@ async def list_reviews(
             d.end_ts as dialogue_end_ts,
             d.point_id,
             d.review_status,
-            dua.attempted,
-            dua.quality_score,
-            dua.categories,
-            dua.customer_reaction,
-            LEFT(dt.text, 200) as text_snippet
+            COUNT(*) OVER () as total_count
         FROM dialogue_reviews dr
         JOIN dialogues d ON dr.dialogue_id = d.dialogue_id
-        LEFT JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
-        WHERE {where_clause}
+        WHERE {_REVIEWS_WHERE}
         ORDER BY dr.created_at DESC
         LIMIT :limit OFFSET :offset
-    """)
+    )
+    SELECT
+        page.*,
+        dua.attempted,
+        dua.quality_score,
+        dua.categories,
+        dua.customer_reaction,
+        LEFT(dt.text, 200) as text_snippet
+    FROM page
+    LEFT JOIN dialogue_upsell_analysis dua ON page.dialogue_id = dua.dialogue_id
+    LEFT JOIN dialogue_transcripts dt ON page.dialogue_id = dt.dialogue_id
+    ORDER BY page.created_at DESC
+""")
+
+_REVIEWS_COUNT_QUERY = text(f"""
+    SELECT COUNT(*)
+    FROM dialogue_reviews dr
+    JOIN dialogues d ON dr.dialogue_id = d.dialogue_id
+    WHERE {_REVIEWS_WHERE}
+""")
+
 
-    result = await session.execute(query, params)
+@router.get(
+    "/reviews",
+    response_model=ReviewListResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def list_reviews(
+    date_from: date | None = Query(None, alias="date", description="Filter by date"),
+    point_id: UUID | None = Query(None, description="Filter by point_id"),
+    status: ReviewStatus | None = Query(None, description="Filter by review status"),
+    reason: ReviewReason | None = Query(None, description="Filter by reason"),
+    limit: int = Query(50, ge=1, le=200, description="Max results"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """
+    List reviews with optional filters.
+    """
+    date_start, date_end = utc_day_range(date_from) if date_from else (None, None)
+    params: dict[str, Any] = {
+        "date_start": date_start,
+        "date_end": date_end,
+        "point_id": point_id,
+        "status": status.value if status else None,
+        "reason": reason.value if reason else None,
+        "limit": limit,
+        "offset": offset,
+    }
+
+    result = await session.execute(_REVIEWS_PAGE_QUERY, params)
     rows = result.fetchall()
 
+    if rows:
+        total = rows[0].total_count
+    elif offset == 0:
+        total = 0
+    else:
+        # Page past the end: the window count has no row to ride on
+        result = await session.execute(_REVIEWS_COUNT_QUERY, params)
+        total = result.scalar() or 0
+
     reviews = [
         ReviewWithDialogue(
             review_id=row.review_id,
@@ -293,7 +307,22 @@ async def list_reviews(
         for row in rows
     ]
 
-    return ReviewListResponse(total=total, reviews=reviews)
+    # Serialize in pydantic-core rather than through jsonable_encoder
+    response = ReviewListResponse(total=total, reviews=reviews)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+_GET_REVIEW_QUERY = text("""
+    SELECT review_id, dialogue_id, created_at, reviewer, flag, reason, notes, corrected
+    FROM dialogue_reviews
+    WHERE review_id = :review_id
+""")
+
+_SET_REVIEW_STATUS_QUERY = text("""
+    UPDATE dialogues
+    SET review_status = :status
+    WHERE dialogue_id = :dialogue_id
+""")
 
 
 @router.patch(
@@ -310,12 +339,7 @@ async def update_review(
     Update review status (mark as resolved).
     """
     # Get review
-    get_query = text("""
-        SELECT review_id, dialogue_id, created_at, reviewer, flag, reason, notes, corrected
-        FROM dialogue_reviews
-        WHERE review_id = :review_id
-    """)
-    result = await session.execute(get_query, {"review_id": review_id})
+    result = await session.execute(_GET_REVIEW_QUERY, {"review_id": review_id})
     row = result.fetchone()
 
     if not row:
@@ -323,12 +347,9 @@ async def update_review(
 
     # Update dialogue review_status
     new_status = "RESOLVED" if resolved else "FLAGGED"
-    update_query = text("""
-        UPDATE dialogues
-        SET review_status = :status
-        WHERE dialogue_id = :dialogue_id
-    """)
-    await session.execute(update_query, {"dialogue_id": row.dialogue_id, "status": new_status})
+    await session.execute(
+        _SET_REVIEW_STATUS_QUERY, {"dialogue_id": row.dialogue_id, "status": new_status}
+    )
     await session.commit()
 
     return ReviewResponse(
@@ -348,6 +369,58 @@ async def update_review(
 # =============================================================================
 
 
+# Locks the dialogue and moves its current analysis into history in one round
+# trip. Nothing is archived unless ASR is done; the caller tells "not found"
+# from "ASR not done" by the returned row. The status reset is a separate
+# statement: row triggers fire at the end of their statement, and the rollup
+# triggers (migration 014) must see the analysis removed while the dialogue
+# is still DONE, then the status change once the analysis is gone.
+_ARCHIVE_ANALYSIS_QUERY = text("""
+    WITH target AS (
+        SELECT dialogue_id, start_ts, point_id, asr_status,
+               analysis_model, analysis_prompt_version
+        FROM dialogues
+        WHERE dialogue_id = :dialogue_id
+        FOR UPDATE
+    ),
+    moved AS (
+        DELETE FROM dialogue_upsell_analysis dua
+        USING target t
+        WHERE dua.dialogue_id = t.dialogue_id AND t.asr_status = 'DONE'
+        RETURNING dua.*
+    ),
+    archived AS (
+        INSERT INTO dialogue_upsell_analysis_history (
+            dialogue_id, attempted, quality_score, categories, closing_question,
+            customer_reaction, evidence_quotes, summary, confidence,
+            analysis_model, analysis_prompt_version, original_created_at
+        )
+        SELECT
+            m.dialogue_id, m.attempted, m.quality_score, m.categories, m.closing_question,
+            m.customer_reaction, m.evidence_quotes, m.summary, m.confidence,
+            t.analysis_model, t.analysis_prompt_version, m.created_at
+        FROM moved m
+        JOIN target t ON t.dialogue_id = m.dialogue_id
+        RETURNING 1
+    )
+    SELECT t.start_ts, t.point_id, t.asr_status,
+           EXISTS (SELECT 1 FROM archived) AS archived
+    FROM target t
+""")
+
+_RESET_ANALYSIS_QUERY = text("""
+    UPDATE dialogues
+    SET analysis_status = 'PENDING',
+        analysis_processing_started_at = NULL,
+        analysis_started_at = NULL,
+        analysis_finished_at = NULL,
+        analysis_error_message = NULL,
+        analysis_model = NULL,
+        analysis_prompt_version = NULL
+    WHERE dialogue_id = :dialogue_id
+""")
+
+
 @router.post(
     "/analysis/rerun/{dialogue_id}",
     response_model=RerunResponse,
@@ -362,18 +435,8 @@ async def rerun_analysis(
 
     Archives current analysis to history and resets analysis_status to PENDING.
     """
-    # Check dialogue exists and has ASR done
-    check_query = text("""
-        SELECT d.dialogue_id, d.asr_status, d.analysis_status,
-               dua.analysis_id, dua.attempted, dua.quality_score, dua.categories,
-               dua.closing_question, dua.customer_reaction, dua.evidence_quotes,
-               dua.summary, dua.confidence, dua.created_at as analysis_created_at,
-               d.analysis_model, d.analysis_prompt_version
-        FROM dialogues d
-        LEFT JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        WHERE d.dialogue_id = :dialogue_id
-    """)
-    result = await session.execute(check_query, {"dialogue_id": dialogue_id})
+    # Archive current analysis if exists
+    result = await session.execute(_ARCHIVE_ANALYSIS_QUERY, {"dialogue_id": dialogue_id})
     row = result.fetchone()
 
     if not row:
@@ -382,60 +445,16 @@ async def rerun_analysis(
     if row.asr_status != "DONE":
         raise HTTPException(status_code=400, detail="ASR not completed for this dialogue")
 
-    archived = False
-
-    # Archive current analysis if exists
-    if row.analysis_id:
-        archive_query = text("""
-            INSERT INTO dialogue_upsell_analysis_history (
-                dialogue_id, attempted, quality_score, categories, closing_question,
-                customer_reaction, evidence_quotes, summary, confidence,
-                analysis_model, analysis_prompt_version, original_created_at
-            )
-            VALUES (
-                :dialogue_id, :attempted, :quality_score, :categories, :closing_question,
-                :customer_reaction, :evidence_quotes, :summary, :confidence,
-                :analysis_model, :analysis_prompt_version, :original_created_at
-            )
-        """)
-        await session.execute(
-            archive_query,
-            {
-                "dialogue_id": dialogue_id,
-                "attempted": row.attempted,
-                "quality_score": row.quality_score,
-                "categories": json.dumps(row.categories) if row.categories else "[]",
-                "closing_question": row.closing_question,
-                "customer_reaction": row.customer_reaction,
-                "evidence_quotes": json.dumps(row.evidence_quotes) if row.evidence_quotes else "[]",
-                "summary": row.summary,
-                "confidence": row.confidence,
-                "analysis_model": row.analysis_model,
-                "analysis_prompt_version": row.analysis_prompt_version,
-                "original_created_at": row.analysis_created_at,
-            },
-        )
-
-        # Delete current analysis
-        delete_query = text("DELETE FROM dialogue_upsell_analysis WHERE dialogue_id = :dialogue_id")
-        await session.execute(delete_query, {"dialogue_id": dialogue_id})
-        archived = True
+    archived = row.archived
 
     # Reset analysis status to PENDING
-    reset_query = text("""
-        UPDATE dialogues
-        SET analysis_status = 'PENDING',
-            analysis_processing_started_at = NULL,
-            analysis_started_at = NULL,
-            analysis_finished_at = NULL,
-            analysis_error_message = NULL,
-            analysis_model = NULL,
-            analysis_prompt_version = NULL
-        WHERE dialogue_id = :dialogue_id
-    """)
-    await session.execute(reset_query, {"dialogue_id": dialogue_id})
+    await session.execute(_RESET_ANALYSIS_QUERY, {"dialogue_id": dialogue_id})
     await session.commit()
 
+    await invalidate_daily_analytics(
+        row.start_ts.astimezone(timezone.utc).date(), row.point_id
+    )
+
     logger.info(
         "analysis_rerun_triggered",
         extra={"dialogue_id": str(dialogue_id), "archived": archived},
@@ -453,150 +472,232 @@ async def rerun_analysis(
 # =============================================================================
 
 
+# Rows fetched per server-side cursor round trip and written per response chunk
+_EXPORT_BATCH_ROWS = 500
+
+# Fastest gzip level: exported text still shrinks several times over, and
+# the compression runs while the client waits on the stream
+_EXPORT_GZIP_LEVEL = 1
+
+_EXPORT_QUERY = text("""
+    SELECT
+        d.dialogue_id::text as dialogue_id,
+        d.point_id::text as point_id,
+        d.register_id::text as register_id,
+        d.start_ts,
+        d.end_ts,
+        d.review_status,
+        dt.text as transcript,
+        dua.attempted as llm_attempted,
+        dua.quality_score as llm_quality_score,
+        dua.categories as llm_categories,
+        dua.closing_question as llm_closing_question,
+        dua.customer_reaction as llm_customer_reaction,
+        dua.summary as llm_summary,
+        dua.evidence_quotes as llm_evidence_quotes,
+        dua.confidence as llm_confidence,
+        dr.review_id::text as review_id,
+        dr.created_at as review_created_at,
+        dr.reason as review_reason,
+        dr.notes as review_notes,
+        dr.corrected as review_corrected
+    FROM dialogues d
+    LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
+    LEFT JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
+    LEFT JOIN dialogue_reviews dr ON d.dialogue_id = dr.dialogue_id
+    WHERE d.start_ts >= :start_ts AND d.start_ts < :end_ts
+      AND d.review_status != 'NONE'
+    ORDER BY d.start_ts
+""")
+
+_EXPORT_CSV_HEADER = [
+    "dialogue_id",
+    "point_id",
+    "start_ts",
+    "end_ts",
+    "review_status",
+    "transcript",
+    "llm_attempted",
+    "llm_quality_score",
+    "llm_categories",
+    "llm_customer_reaction",
+    "llm_summary",
+    "review_reason",
+    "review_notes",
+    "corrected_attempted",
+    "corrected_quality_score",
+    "corrected_categories",
+    "corrected_customer_reaction",
+]
+
+
+async def _export_batches(start_ts: datetime, end_ts: datetime) -> AsyncIterator[list[Any]]:
+    """
+    Yield export rows in batches from a server-side cursor.
+
+    The response body is produced after the endpoint has returned, so the
+    stream opens its own session, on the export pool, instead of using the
+    request-scoped one.
+    """
+    async with get_export_session_context() as session:
+        result = await session.stream(
+            _EXPORT_QUERY,
+            {"start_ts": start_ts, "end_ts": end_ts},
+            execution_options={"yield_per": _EXPORT_BATCH_ROWS},
+        )
+        async for batch in result.partitions():
+            yield batch
+
+
+def _export_json_item(row: Any) -> dict[str, Any]:
+    return {
+        "dialogue_id": row.dialogue_id,
+        "point_id": row.point_id,
+        "register_id": row.register_id,
+        "start_ts": row.start_ts.isoformat(),
+        "end_ts": row.end_ts.isoformat(),
+        "review_status": row.review_status,
+        "transcript": row.transcript,
+        "llm_analysis": {
+            "attempted": row.llm_attempted,
+            "quality_score": row.llm_quality_score,
+            "categories": row.llm_categories,
+            "closing_question": row.llm_closing_question,
+            "customer_reaction": row.llm_customer_reaction,
+            "summary": row.llm_summary,
+            "evidence_quotes": row.llm_evidence_quotes,
+            "confidence": row.llm_confidence,
+        },
+        "review": {
+            "review_id": row.review_id,
+            "created_at": row.review_created_at.isoformat() if row.review_created_at else None,
+            "reason": row.review_reason,
+            "notes": row.review_notes,
+            "corrected": row.review_corrected,
+        } if row.review_id else None,
+    }
+
+
+def _export_csv_row(row: Any) -> list[Any]:
+    corrected = row.review_corrected or {}
+    return [
+        row.dialogue_id,
+        row.point_id,
+        row.start_ts.isoformat(),
+        row.end_ts.isoformat(),
+        row.review_status,
+        row.transcript,
+        row.llm_attempted,
+        row.llm_quality_score,
+        json.dumps(row.llm_categories) if row.llm_categories else "",
+        row.llm_customer_reaction,
+        row.llm_summary,
+        row.review_reason,
+        row.review_notes,
+        corrected.get("attempted", ""),
+        corrected.get("quality_score", ""),
+        json.dumps(corrected.get("categories", [])) if corrected.get("categories") else "",
+        corrected.get("customer_reaction", ""),
+    ]
+
+
+async def _stream_json(batches: AsyncIterator[list[Any]]) -> AsyncIterator[str]:
+    """Encode rows as one indented JSON array, a batch per chunk."""
+    separator = "[\n"
+    async for batch in batches:
+        if not batch:
+            continue
+        items = json.dumps(
+            [_export_json_item(row) for row in batch], ensure_ascii=False, indent=2
+        )
+        # Drop the batch list's own "[\n" and "\n]"; its items are already
+        # nested one level, as in the whole export's list
+        yield separator + items[2:-2]
+        separator = ",\n"
+    yield "[]" if separator == "[\n" else "\n]"
+
+
+async def _stream_csv(batches: AsyncIterator[list[Any]]) -> AsyncIterator[str]:
+    """Encode rows as CSV with a header line, a batch per chunk."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(_EXPORT_CSV_HEADER)
+    async for batch in batches:
+        writer.writerows(_export_csv_row(row) for row in batch)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    yield output.getvalue()
+
+
+async def _stream_gzip(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Gzip-compress a text stream as it is produced."""
+    compressor = zlib.compressobj(_EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk.encode()):
+            yield data
+    yield compressor.flush()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows gzip.
+
+    A coding with q=0 is refused; an explicit gzip (or x-gzip) entry takes
+    precedence over "*".
+    """
+    wildcard = False
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return qvalue > 0
+        if coding == "*":
+            wildcard = qvalue > 0
+    return wildcard
+
+
 @router.get(
     "/exports/reviews",
     dependencies=[Depends(get_current_user)],
 )
 async def export_reviews(
+    request: Request,
     date_from: date = Query(..., alias="from", description="Start date"),
     date_to: date = Query(..., alias="to", description="End date"),
     format: ExportFormat = Query(ExportFormat.JSON, description="Export format"),
-    session: AsyncSession = Depends(get_session),
 ):
     """
     Export reviewed/flagged dialogues for dataset building.
 
-    Returns dialogues with their reviews, analysis, and transcripts.
+    Returns dialogues with their reviews, analysis, and transcripts. Rows are
+    streamed from the database in batches, so memory use does not grow with
+    the export range. The body is gzip-compressed when the client accepts it.
     """
-    start_ts = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=timezone.utc)
-    end_ts = datetime.combine(date_to, datetime.max.time()).replace(tzinfo=timezone.utc)
+    start_ts, _ = utc_day_range(date_from)
+    _, end_ts = utc_day_range(date_to)
 
-    query = text("""
-        SELECT
-            d.dialogue_id,
-            d.point_id,
-            d.register_id,
-            d.start_ts,
-            d.end_ts,
-            d.review_status,
-            dt.text as transcript,
-            dua.attempted as llm_attempted,
-            dua.quality_score as llm_quality_score,
-            dua.categories as llm_categories,
-            dua.closing_question as llm_closing_question,
-            dua.customer_reaction as llm_customer_reaction,
-            dua.summary as llm_summary,
-            dua.evidence_quotes as llm_evidence_quotes,
-            dua.confidence as llm_confidence,
-            dr.review_id,
-            dr.created_at as review_created_at,
-            dr.reason as review_reason,
-            dr.notes as review_notes,
-            dr.corrected as review_corrected
-        FROM dialogues d
-        LEFT JOIN dialogue_transcripts dt ON d.dialogue_id = dt.dialogue_id
-        LEFT JOIN dialogue_upsell_analysis dua ON d.dialogue_id = dua.dialogue_id
-        LEFT JOIN dialogue_reviews dr ON d.dialogue_id = dr.dialogue_id
-        WHERE d.start_ts >= :start_ts AND d.start_ts < :end_ts
-          AND d.review_status != 'NONE'
-        ORDER BY d.start_ts
-    """)
-
-    result = await session.execute(query, {"start_ts": start_ts, "end_ts": end_ts})
-    rows = result.fetchall()
+    batches = _export_batches(start_ts, end_ts)
 
     if format == ExportFormat.JSON:
-        data = []
-        for row in rows:
-            item = {
-                "dialogue_id": str(row.dialogue_id),
-                "point_id": str(row.point_id),
-                "register_id": str(row.register_id),
-                "start_ts": row.start_ts.isoformat(),
-                "end_ts": row.end_ts.isoformat(),
-                "review_status": row.review_status,
-                "transcript": row.transcript,
-                "llm_analysis": {
-                    "attempted": row.llm_attempted,
-                    "quality_score": row.llm_quality_score,
-                    "categories": row.llm_categories,
-                    "closing_question": row.llm_closing_question,
-                    "customer_reaction": row.llm_customer_reaction,
-                    "summary": row.llm_summary,
-                    "evidence_quotes": row.llm_evidence_quotes,
-                    "confidence": row.llm_confidence,
-                },
-                "review": {
-                    "review_id": str(row.review_id) if row.review_id else None,
-                    "created_at": row.review_created_at.isoformat() if row.review_created_at else None,
-                    "reason": row.review_reason,
-                    "notes": row.review_notes,
-                    "corrected": row.review_corrected,
-                } if row.review_id else None,
-            }
-            data.append(item)
-
-        content = json.dumps(data, ensure_ascii=False, indent=2)
-        return StreamingResponse(
-            io.StringIO(content),
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f'attachment; filename="reviews_{date_from}_{date_to}.json"'
-            },
-        )
-
+        body, media_type = _stream_json(batches), "application/json"
     else:  # CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            "dialogue_id",
-            "point_id",
-            "start_ts",
-            "end_ts",
-            "review_status",
-            "transcript",
-            "llm_attempted",
-            "llm_quality_score",
-            "llm_categories",
-            "llm_customer_reaction",
-            "llm_summary",
-            "review_reason",
-            "review_notes",
-            "corrected_attempted",
-            "corrected_quality_score",
-            "corrected_categories",
-            "corrected_customer_reaction",
-        ])
-
-        for row in rows:
-            corrected = row.review_corrected or {}
-            writer.writerow([
-                str(row.dialogue_id),
-                str(row.point_id),
-                row.start_ts.isoformat(),
-                row.end_ts.isoformat(),
-                row.review_status,
-                row.transcript,
-                row.llm_attempted,
-                row.llm_quality_score,
-                json.dumps(row.llm_categories) if row.llm_categories else "",
-                row.llm_customer_reaction,
-                row.llm_summary,
-                row.review_reason,
-                row.review_notes,
-                corrected.get("attempted", ""),
-                corrected.get("quality_score", ""),
-                json.dumps(corrected.get("categories", [])) if corrected.get("categories") else "",
-                corrected.get("customer_reaction", ""),
-            ])
+        body, media_type = _stream_csv(batches), "text/csv"
 
-        output.seek(0)
-        return StreamingResponse(
-            output,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f'attachment; filename="reviews_{date_from}_{date_to}.csv"'
-            },
-        )
+    headers = {
+        "Content-Disposition": f'attachment; filename="reviews_{date_from}_{date_to}.{format.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body = _stream_gzip(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
@@ -1,13 +1,15 @@
 """File storage management for audio chunks."""
 
+import asyncio
+import errno
 import logging
 import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 from uuid import UUID
 
-import aiofiles
 import aiofiles.os
 
 from .settings import get_settings
@@ -21,6 +23,25 @@ class StorageError(Exception):
     pass
 
 
+class ChunkTooLargeError(StorageError):
+    """Uploaded chunk exceeds the size limit."""
+
+    pass
+
+
+class EmptyChunkError(StorageError):
+    """Uploaded chunk has no content."""
+
+    pass
+
+
+# Bytes copied from the upload to storage per read
+_COPY_BUFFER_SIZE = 64 * 1024
+
+# Unnamed temp files need O_TMPFILE and /proc to link them into place
+_UNNAMED_TEMP_FILES = hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd")
+
+
 def get_chunk_path(
     point_id: UUID,
     register_id: UUID,
@@ -42,62 +63,115 @@ def get_chunk_path(
     )
 
 
+def _open_temp_file(dir_path: Path) -> tuple[int, str | None]:
+    """
+    Open a file in dir_path to write a chunk into before it is published.
+
+    Where supported (Linux), the file is unnamed (O_TMPFILE): nothing is left
+    behind if the upload fails or the process dies mid-write. Otherwise a
+    named temp file is created and its path returned for the rename.
+    """
+    if _UNNAMED_TEMP_FILES:
+        try:
+            return os.open(dir_path, os.O_TMPFILE | os.O_WRONLY, 0o600), None
+        except IsADirectoryError:
+            pass  # Kernel without O_TMPFILE support
+        except OSError as e:
+            if e.errno != errno.EOPNOTSUPP:
+                raise
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix="chunk_", dir=dir_path)
+    return fd, temp_path
+
+
+def _write_chunk_file(source: BinaryIO, full_path: Path, max_size_bytes: int) -> int:
+    """Copy source to full_path through a temp file; returns the size."""
+    dir_path = full_path.parent
+
+    # Write to temp file first, then publish it atomically. The hour
+    # directory exists for all but its first chunk, so it is only created on
+    # a miss
+    try:
+        fd, temp_path = _open_temp_file(dir_path)
+    except FileNotFoundError:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = _open_temp_file(dir_path)
+
+    try:
+        file_size = 0
+        with os.fdopen(fd, "wb") as f:
+            while data := source.read(_COPY_BUFFER_SIZE):
+                file_size += len(data)
+                if file_size > max_size_bytes:
+                    raise ChunkTooLargeError(
+                        f"File exceeds maximum size of {max_size_bytes} bytes"
+                    )
+                f.write(data)
+
+            if file_size == 0:
+                raise EmptyChunkError("Empty file")
+
+            if temp_path is None:
+                # Give the unnamed file its name; chunk paths are unique.
+                # Passing a dir fd makes os.link use linkat() with
+                # AT_SYMLINK_FOLLOW, which resolves the /proc link to the
+                # file; the fd itself is ignored for an absolute path
+                f.flush()
+                os.link(
+                    f"/proc/self/fd/{f.fileno()}",
+                    full_path,
+                    src_dir_fd=f.fileno(),
+                    follow_symlinks=True,
+                )
+
+        if temp_path is not None:
+            # Atomic rename
+            os.replace(temp_path, full_path)
+        return file_size
+
+    except BaseException:
+        # Clean up temp file on error
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
 async def save_chunk_file(
-    content: bytes,
+    source: BinaryIO,
     relative_path: str,
+    max_size_bytes: int,
 ) -> tuple[str, int]:
     """
-    Save audio chunk to storage atomically.
+    Stream an audio chunk to storage atomically.
+
+    The upload is copied in fixed-size reads, so memory use does not depend
+    on the chunk size, and the limit is enforced while copying. The whole
+    copy runs in one worker thread rather than one thread hop per read and
+    write.
 
     Args:
-        content: File content bytes
+        source: Upload file to read the content from (UploadFile.file)
         relative_path: Relative path within storage dir
+        max_size_bytes: Maximum accepted content size
 
     Returns:
         Tuple of (full_path, file_size_bytes)
 
     Raises:
+        ChunkTooLargeError: If the content exceeds max_size_bytes
+        EmptyChunkError: If the content is empty
         StorageError: If save fails
     """
     settings = get_settings()
     base_dir = Path(settings.audio_storage_dir)
     full_path = base_dir / relative_path
-    dir_path = full_path.parent
 
     try:
-        # Ensure directory exists
-        await aiofiles.os.makedirs(dir_path, exist_ok=True)
-
-        # Write to temp file first, then rename atomically
-        fd, temp_path = tempfile.mkstemp(
-            suffix=".tmp",
-            prefix="chunk_",
-            dir=dir_path,
+        file_size = await asyncio.to_thread(
+            _write_chunk_file, source, full_path, max_size_bytes
         )
-        os.close(fd)
-
-        try:
-            async with aiofiles.open(temp_path, "wb") as f:
-                await f.write(content)
 
-            # Atomic rename
-            await aiofiles.os.rename(temp_path, full_path)
-
-            file_size = len(content)
-            logger.info(
-                "chunk_file_saved",
-                extra={
-                    "path": relative_path,
-                    "size_bytes": file_size,
-                },
-            )
-            return str(full_path), file_size
-
-        except Exception:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+    except StorageError:
+        raise
 
     except Exception as e:
         logger.error(
@@ -106,6 +180,23 @@ async def save_chunk_file(
         )
         raise StorageError(f"Failed to save chunk: {e}") from e
 
+    logger.info(
+        "chunk_file_saved",
+        extra={
+            "path": relative_path,
+            "size_bytes": file_size,
+        },
+    )
+    return str(full_path), file_size
+
+
+def _write_test_file(base_dir: Path) -> None:
+    """Create base_dir if needed, then write and remove a test file in it."""
+    base_dir.mkdir(parents=True, exist_ok=True)
+    test_file = base_dir / ".write_test"
+    test_file.write_text("test")
+    test_file.unlink()
+
 
 async def check_storage_writable() -> bool:
     """Check if storage directory is writable."""
@@ -113,14 +204,7 @@ async def check_storage_writable() -> bool:
     base_dir = Path(settings.audio_storage_dir)
 
     try:
-        # Ensure base dir exists
-        await aiofiles.os.makedirs(base_dir, exist_ok=True)
-
-        # Try to write a test file
-        test_file = base_dir / ".write_test"
-        async with aiofiles.open(test_file, "w") as f:
-            await f.write("test")
-        await aiofiles.os.remove(test_file)
+        await asyncio.to_thread(_write_test_file, base_dir)
         return True
 
     except Exception as e:
@@ -1,12 +1,13 @@
 """User management API endpoints."""
 
+import asyncio
 import logging
 from datetime import timedelta
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .auth import (
@@ -15,6 +16,7 @@ from .auth import (
     get_current_admin_user,
     get_current_user,
     hash_password,
+    invalidate_user_cache,
     update_user_last_login,
 )
 from .db import get_session
@@ -58,8 +60,8 @@ class UserResponse(BaseModel):
     last_login_at: str | None
 
     @classmethod
-    def from_orm(cls, user: User) -> "UserResponse":
-        """Create from ORM model."""
+    def from_orm(cls, user: User | Row) -> "UserResponse":
+        """Create from ORM model or a row with the same columns."""
         return cls(
             user_id=user.user_id,
             username=user.username,
@@ -141,15 +143,27 @@ async def get_current_user_info(
     return UserResponse.from_orm(current_user)
 
 
+# Column rows rather than User entities: the list is read-only, so it skips
+# entity construction and the session identity map
+_USER_LIST_QUERY = select(
+    User.user_id,
+    User.username,
+    User.full_name,
+    User.is_admin,
+    User.is_active,
+    User.created_at,
+    User.last_login_at,
+).order_by(User.created_at)
+
+
 @router.get("/users", response_model=list[UserResponse])
 async def list_users(
     session: AsyncSession = Depends(get_session),
     _admin: User = Depends(get_current_admin_user),
 ) -> list[UserResponse]:
     """List all users (admin only)."""
-    result = await session.execute(select(User).order_by(User.created_at))
-    users = result.scalars().all()
-    return [UserResponse.from_orm(user) for user in users]
+    result = await session.execute(_USER_LIST_QUERY)
+    return [UserResponse.from_orm(row) for row in result.all()]
 
 
 @router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -173,7 +187,7 @@ async def create_user(
     user = User(
         user_id=uuid4(),
         username=request.username,
-        password_hash=hash_password(request.password),
+        password_hash=await asyncio.to_thread(hash_password, request.password),
         full_name=request.full_name,
         is_admin=request.is_admin,
         is_active=True,
@@ -181,7 +195,6 @@ async def create_user(
 
     session.add(user)
     await session.commit()
-    await session.refresh(user)
 
     logger.info(
         "user_created",
@@ -216,14 +229,14 @@ async def update_user(
     if request.full_name is not None:
         user.full_name = request.full_name
     if request.password is not None:
-        user.password_hash = hash_password(request.password)
+        user.password_hash = await asyncio.to_thread(hash_password, request.password)
     if request.is_admin is not None:
         user.is_admin = request.is_admin
     if request.is_active is not None:
         user.is_active = request.is_active
 
     await session.commit()
-    await session.refresh(user)
+    await invalidate_user_cache(user.user_id)
 
     logger.info(
         "user_updated",
@@ -261,6 +274,7 @@ async def delete_user(
 
     await session.delete(user)
     await session.commit()
+    await invalidate_user_cache(user_id)
 
     logger.info(
         "user_deleted",
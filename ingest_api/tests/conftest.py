@@ -6,14 +6,18 @@ from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
 
 # Set test environment before importing app
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+# Nothing listens here, so every Redis cache lookup misses and tests cannot
+# see entries cached by one another
+os.environ["REDIS_URL"] = "redis://localhost:1/0"
 os.environ["AUDIO_STORAGE_DIR"] = "/tmp/ingest_api_test"
 os.environ["ADMIN_TOKEN"] = "test-admin-token"
 os.environ["INTERNAL_TOKEN"] = "test-internal-token"
@@ -31,13 +35,24 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def engine():
-    """Create test database engine."""
+    """Create test database engine and schema, once per test run."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
     )
+
+    # pysqlite's implicit transactions do not nest: let SQLAlchemy emit BEGIN
+    # itself, so each test can run inside a transaction with savepoints
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -45,35 +60,46 @@ async def engine():
 
 
 @pytest.fixture
-async def session(engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    factory = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
+async def connection(engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Database connection whose transaction is rolled back after the test."""
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+def _test_session(connection: AsyncConnection) -> AsyncSession:
+    """Session on the test's connection; its commits only release savepoints."""
+    return AsyncSession(
+        bind=connection,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-    async with factory() as session:
+
+
+@pytest.fixture
+async def session(connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session."""
+    async with _test_session(connection) as session:
         yield session
 
 
+@pytest.fixture(scope="session")
+def app():
+    """Create the application once per test run."""
+    return create_app()
+
+
 @pytest.fixture
-async def client(engine, tmp_path) -> AsyncGenerator[AsyncClient, None]:
+async def client(app, connection, tmp_path) -> AsyncGenerator[AsyncClient, None]:
     """Create test HTTP client."""
     # Set storage dir and clear settings cache
     os.environ["AUDIO_STORAGE_DIR"] = str(tmp_path)
     get_settings.cache_clear()
 
-    app = create_app()
-
     # Override session dependency
-    factory = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
     async def override_get_session():
-        async with factory() as session:
+        async with _test_session(connection) as session:
             yield session
 
     app.dependency_overrides[get_session] = override_get_session
@@ -83,6 +109,7 @@ async def client(engine, tmp_path) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
     # Cleanup: clear cache again for next test
+    app.dependency_overrides.clear()
     get_settings.cache_clear()
 
 
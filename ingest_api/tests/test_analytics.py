@@ -0,0 +1,63 @@
+"""Tests for analytics response helpers."""
+
+import pytest
+from starlette.requests import Request
+
+from ingest_api.analytics import _etag_response
+
+PAYLOAD = '{"date": "2026-01-28", "dialogues_total": 3}'
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _etag() -> str:
+    return _etag_response(_request(), PAYLOAD).headers["ETag"]
+
+
+class TestEtagResponse:
+    """Tests for conditional GET handling of cached analytics payloads."""
+
+    def test_200_without_if_none_match(self):
+        """A plain request gets the body with its ETag."""
+        response = _etag_response(_request(), PAYLOAD)
+
+        assert response.status_code == 200
+        assert response.body == PAYLOAD.encode()
+        assert response.headers["ETag"].startswith('"')
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            "{etag}",
+            "W/{etag}",
+            '"other", {etag}',
+            '"other",W/{etag}',
+            "*",
+        ],
+        ids=["strong", "weak", "list", "list-weak", "star"],
+    )
+    def test_304_when_matching(self, if_none_match: str):
+        """Strong, weak, listed and wildcard matches are not modified."""
+        etag = _etag()
+        response = _etag_response(_request(if_none_match.format(etag=etag)), PAYLOAD)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ['"other"', 'W/"other", "another"', ""],
+        ids=["other", "other-list", "empty"],
+    )
+    def test_200_when_not_matching(self, if_none_match: str):
+        """A stale ETag gets the full body."""
+        response = _etag_response(_request(if_none_match), PAYLOAD)
+
+        assert response.status_code == 200
+        assert response.body == PAYLOAD.encode()
@@ -194,6 +194,47 @@ class TestChunkUpload:
         assert response.status_code == 422
         assert "Empty file" in response.json()["detail"]
 
+    async def test_upload_chunk_413_too_large(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+        device_ids: dict,
+    ):
+        """File over the size limit returns 413 and leaves nothing in storage."""
+        from pathlib import Path
+
+        from ingest_api.settings import get_settings
+
+        os.environ["MAX_UPLOAD_SIZE_BYTES"] = "100000"
+        get_settings.cache_clear()
+        try:
+            response = await client.post(
+                "/api/v1/chunks",
+                headers={"Authorization": f"Bearer {device_token}"},
+                data={
+                    "point_id": str(device_ids["point_id"]),
+                    "register_id": str(device_ids["register_id"]),
+                    "device_id": str(device_ids["device_id"]),
+                    "start_ts": "2026-01-28T10:00:00+00:00",
+                    "end_ts": "2026-01-28T10:01:00+00:00",
+                    "codec": "opus",
+                    "sample_rate": "48000",
+                    "channels": "1",
+                },
+                files={
+                    "chunk_file": ("test.ogg", BytesIO(b"OggS" + os.urandom(100000)), "audio/ogg")
+                },
+            )
+        finally:
+            del os.environ["MAX_UPLOAD_SIZE_BYTES"]
+            get_settings.cache_clear()
+
+        assert response.status_code == 413
+
+        storage_dir = Path(os.environ["AUDIO_STORAGE_DIR"])
+        assert not [p for p in storage_dir.rglob("*") if p.is_file()]
+
     async def test_upload_chunk_422_invalid_timestamps(
         self,
         client: AsyncClient,
@@ -221,6 +262,198 @@ class TestChunkUpload:
         assert response.status_code == 422
         assert "end_ts must be after start_ts" in response.json()["detail"]
 
+    async def test_upload_chunk_batch_success(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+        device_ids: dict,
+    ):
+        """Batch upload stores every chunk and returns one entry per file."""
+        import json
+        from pathlib import Path
+
+        metadata = [
+            {
+                "point_id": str(device_ids["point_id"]),
+                "register_id": str(device_ids["register_id"]),
+                "device_id": str(device_ids["device_id"]),
+                "start_ts": f"2026-01-28T10:0{i}:00+00:00",
+                "end_ts": f"2026-01-28T10:0{i + 1}:00+00:00",
+                "codec": "opus",
+                "sample_rate": 48000,
+                "channels": 1,
+            }
+            for i in range(3)
+        ]
+        contents = [b"OggS" + os.urandom(1000) for _ in metadata]
+
+        response = await client.post(
+            "/api/v1/chunks/batch",
+            headers={"Authorization": f"Bearer {device_token}"},
+            data={"metadata": json.dumps(metadata)},
+            files=[
+                ("chunk_files", (f"test{i}.ogg", BytesIO(content), "audio/ogg"))
+                for i, content in enumerate(contents)
+            ],
+        )
+
+        assert response.status_code == 200
+        chunks = response.json()["chunks"]
+        assert len(chunks) == 3
+
+        storage_dir = Path(os.environ["AUDIO_STORAGE_DIR"])
+        for chunk, content in zip(chunks, contents):
+            assert (storage_dir / chunk["stored_path"]).read_bytes() == content
+
+    async def test_upload_chunk_batch_422_empty_file_stores_nothing(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+        device_ids: dict,
+    ):
+        """A rejected chunk fails the whole batch and removes stored files."""
+        import json
+        from pathlib import Path
+
+        metadata = [
+            {
+                "point_id": str(device_ids["point_id"]),
+                "register_id": str(device_ids["register_id"]),
+                "device_id": str(device_ids["device_id"]),
+                "start_ts": f"2026-01-28T10:0{i}:00+00:00",
+                "end_ts": f"2026-01-28T10:0{i + 1}:00+00:00",
+                "codec": "opus",
+                "sample_rate": 48000,
+                "channels": 1,
+            }
+            for i in range(2)
+        ]
+
+        response = await client.post(
+            "/api/v1/chunks/batch",
+            headers={"Authorization": f"Bearer {device_token}"},
+            data={"metadata": json.dumps(metadata)},
+            files=[
+                ("chunk_files", ("test0.ogg", BytesIO(b"OggS" + os.urandom(1000)), "audio/ogg")),
+                ("chunk_files", ("test1.ogg", BytesIO(b""), "audio/ogg")),
+            ],
+        )
+
+        assert response.status_code == 422
+
+        storage_dir = Path(os.environ["AUDIO_STORAGE_DIR"])
+        assert not [p for p in storage_dir.rglob("*") if p.is_file()]
+
+
+class TestDeviceCache:
+    """Tests for the Redis device cache used by chunk uploads."""
+
+    @pytest.fixture(autouse=True)
+    def fake_redis(self, monkeypatch: pytest.MonkeyPatch):
+        """Serve the cache from an in-process fake Redis."""
+        import fakeredis
+
+        monkeypatch.setattr("ingest_api.cache._redis", fakeredis.FakeAsyncRedis())
+
+    @pytest.fixture
+    def disable_device(self, connection, registered_device: Device):
+        """What PATCH /admin/devices does to disable the device."""
+        from sqlalchemy import update
+
+        from ingest_api.auth import invalidate_device_cache
+
+        async def disable():
+            await connection.execute(
+                update(Device)
+                .where(Device.device_id == registered_device.device_id)
+                .values(is_enabled=False)
+            )
+            await invalidate_device_cache(registered_device.token_hash)
+
+        return disable
+
+    @staticmethod
+    def _upload(client: AsyncClient, device_token: str, device_ids: dict, start_ts: str):
+        return client.post(
+            "/api/v1/chunks",
+            headers={"Authorization": f"Bearer {device_token}"},
+            data={
+                "point_id": str(device_ids["point_id"]),
+                "register_id": str(device_ids["register_id"]),
+                "device_id": str(device_ids["device_id"]),
+                "start_ts": start_ts,
+                "end_ts": start_ts.replace(":00:00+", ":01:00+"),
+                "codec": "opus",
+                "sample_rate": "48000",
+                "channels": "1",
+            },
+            files={
+                "chunk_file": ("test.ogg", BytesIO(b"OggS" + os.urandom(100)), "audio/ogg")
+            },
+        )
+
+    async def test_device_disabled_mid_upload_is_rejected(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+        device_ids: dict,
+        disable_device,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """The post-upload last_seen refresh must not re-cache a disabled device."""
+        from ingest_api import api
+
+        save_chunk_file = api.save_chunk_file
+
+        async def save_and_disable(*args, **kwargs):
+            await disable_device()
+            return await save_chunk_file(*args, **kwargs)
+
+        monkeypatch.setattr(api, "save_chunk_file", save_and_disable)
+        response = await self._upload(
+            client, device_token, device_ids, "2026-01-28T10:00:00+00:00"
+        )
+        assert response.status_code == 200
+
+        monkeypatch.setattr(api, "save_chunk_file", save_chunk_file)
+        response = await self._upload(
+            client, device_token, device_ids, "2026-01-28T11:00:00+00:00"
+        )
+        assert response.status_code in (401, 403)
+
+    async def test_device_disabled_after_lookup_is_rejected(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+        device_ids: dict,
+        disable_device,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A cache miss that loaded the device before it was disabled must not cache it."""
+        from ingest_api import auth
+
+        cache_device = auth.cache_device
+
+        async def disable_and_cache(*args, **kwargs):
+            await disable_device()
+            await cache_device(*args, **kwargs)
+
+        monkeypatch.setattr(auth, "cache_device", disable_and_cache)
+        response = await self._upload(
+            client, device_token, device_ids, "2026-01-28T10:00:00+00:00"
+        )
+        assert response.status_code == 200
+
+        monkeypatch.setattr(auth, "cache_device", cache_device)
+        response = await self._upload(
+            client, device_token, device_ids, "2026-01-28T11:00:00+00:00"
+        )
+        assert response.status_code in (401, 403)
+
 
 class TestAdminEndpoints:
     """Tests for admin device management endpoints."""
@@ -305,6 +538,63 @@ class TestAdminEndpoints:
         assert response.status_code == 404
 
 
+class TestDeviceTokenConflicts:
+    """Admin device changes that would give two enabled devices one token."""
+
+    @pytest.fixture(autouse=True)
+    def admin_user(self, app, client: AsyncClient):
+        """Authenticate admin requests; the client fixture clears overrides."""
+        from ingest_api.auth import get_current_user
+
+        app.dependency_overrides[get_current_user] = lambda: None
+
+    async def test_create_device_409_token_in_use(
+        self,
+        client: AsyncClient,
+        registered_device: Device,
+        device_token: str,
+    ):
+        """Registering a second enabled device with the same token returns 409."""
+        response = await client.post(
+            "/api/v1/admin/devices",
+            json={
+                "device_id": str(uuid4()),
+                "point_id": str(uuid4()),
+                "register_id": str(uuid4()),
+                "token_plain": device_token,
+            },
+        )
+
+        assert response.status_code == 409
+
+    async def test_enable_device_409_token_in_use(
+        self,
+        client: AsyncClient,
+        session,
+        registered_device: Device,
+        device_token: str,
+    ):
+        """Re-enabling a device whose token another enabled device uses returns 409."""
+        registered_device.is_enabled = False
+        session.add(
+            Device(
+                device_id=uuid4(),
+                point_id=uuid4(),
+                register_id=uuid4(),
+                token_hash=registered_device.token_hash,
+                is_enabled=True,
+            )
+        )
+        await session.commit()
+
+        response = await client.patch(
+            f"/api/v1/admin/devices/{registered_device.device_id}",
+            json={"is_enabled": True},
+        )
+
+        assert response.status_code == 409
+
+
 class TestInternalChunkDownload:
     """Tests for GET /api/v1/internal/chunks/{chunk_id}/file endpoint."""
 
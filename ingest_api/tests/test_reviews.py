@@ -0,0 +1,112 @@
+"""Tests for the review export stream encoders."""
+
+import gzip
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from ingest_api.reviews import (
+    _accepts_gzip,
+    _export_json_item,
+    _stream_gzip,
+    _stream_json,
+)
+
+
+def _export_row(index: int, reviewed: bool = True) -> SimpleNamespace:
+    """Build a row shaped like the export query's result."""
+    start_ts = datetime(2026, 1, 28, 10, index, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        dialogue_id=str(uuid4()),
+        point_id=str(uuid4()),
+        register_id=str(uuid4()),
+        start_ts=start_ts,
+        end_ts=start_ts.replace(second=30),
+        review_status="REVIEWED" if reviewed else "FLAGGED",
+        transcript=f"Добрый день! Хотите десерт к кофе? №{index}",
+        llm_attempted="yes",
+        llm_quality_score=2,
+        llm_categories=["десерт", "drink"],
+        llm_closing_question=True,
+        llm_customer_reaction="accepted",
+        llm_summary="Кассир предложил «десерт»",
+        llm_evidence_quotes=["Хотите десерт?"],
+        llm_confidence=0.9,
+        review_id=str(uuid4()) if reviewed else None,
+        review_created_at=start_ts if reviewed else None,
+        review_reason="wrong_category" if reviewed else None,
+        review_notes="Заметка" if reviewed else None,
+        review_corrected={"attempted": "no"} if reviewed else None,
+    )
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
+
+
+class TestStreamJson:
+    """_stream_json must produce exactly what a single json.dumps would."""
+
+    @pytest.mark.parametrize(
+        "batch_sizes",
+        [[], [0], [1], [3], [2, 0, 1, 3]],
+        ids=["no-batches", "empty-batch", "one-row", "one-batch", "several-batches"],
+    )
+    async def test_matches_json_dumps(self, batch_sizes: list[int]):
+        """Byte-identical to json.dumps of all rows, non-ASCII included."""
+        rows = iter(_export_row(i, reviewed=i % 2 == 0) for i in range(sum(batch_sizes)))
+        batches = [[next(rows) for _ in range(size)] for size in batch_sizes]
+        all_rows = [row for batch in batches for row in batch]
+
+        body = "".join(await _collect(_stream_json(_aiter(batches))))
+
+        expected = json.dumps(
+            [_export_json_item(row) for row in all_rows], ensure_ascii=False, indent=2
+        )
+        assert body.encode() == expected.encode()
+
+
+class TestStreamGzip:
+    """_stream_gzip must produce a valid gzip member of the whole stream."""
+
+    async def test_round_trip(self):
+        """gzip.decompress of the joined chunks restores the text."""
+        chunks = ["[\n", "", "Добрый день", "x" * 100_000, "\n]"]
+
+        body = b"".join(await _collect(_stream_gzip(_aiter(chunks))))
+
+        assert gzip.decompress(body) == "".join(chunks).encode()
+
+    async def test_round_trip_empty(self):
+        """An empty stream still yields a valid gzip body."""
+        body = b"".join(await _collect(_stream_gzip(_aiter([]))))
+
+        assert gzip.decompress(body) == b""
+
+
+class TestAcceptsGzip:
+    """Exports are only gzipped when Accept-Encoding allows it."""
+
+    @pytest.mark.parametrize(
+        "accept_encoding",
+        ["gzip", "gzip, deflate, br", "br;q=1.0, GZIP;q=0.5", "x-gzip", "*", "identity, *;q=0.1"],
+    )
+    def test_accepted(self, accept_encoding: str):
+        """gzip, x-gzip or a wildcard with a non-zero q-value."""
+        assert _accepts_gzip(accept_encoding)
+
+    @pytest.mark.parametrize(
+        "accept_encoding",
+        ["", "identity", "br, deflate", "gzip;q=0", "gzip; q=0.000", "*;q=0", "*, gzip;q=0"],
+    )
+    def test_refused(self, accept_encoding: str):
+        """No gzip entry, or gzip refused with q=0."""
+        assert not _accepts_gzip(accept_encoding)
@@ -8,6 +8,12 @@ import subprocess
 
 log = logging.getLogger(__name__)
 
+# Matches `arecord -l` lines like:
+# card 1: Device [USB Audio Device], device 0: USB Audio [USB Audio]
+_DEVICE_LINE_RE = re.compile(
+    r"card\s+(\d+):\s+(\S+)\s+\[(.+?)\],\s+device\s+(\d+):\s+(.+?)\s+\[(.+?)\]"
+)
+
 
 class AudioDeviceError(Exception):
     """Raised when the configured audio device is unavailable."""
@@ -24,12 +30,8 @@ def list_capture_devices() -> list[dict[str, str]]:
         log.warning("arecord_list_failed", extra={"error": str(exc)})
         return devices
 
-    # Parse lines like: card 1: Device [USB Audio Device], device 0: USB Audio [USB Audio]
-    pattern = re.compile(
-        r"card\s+(\d+):\s+(\S+)\s+\[(.+?)\],\s+device\s+(\d+):\s+(.+?)\s+\[(.+?)\]"
-    )
     for line in output.splitlines():
-        m = pattern.search(line)
+        m = _DEVICE_LINE_RE.search(line)
         if m:
             devices.append({
                 "card": m.group(1),
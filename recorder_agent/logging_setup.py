@@ -9,6 +9,10 @@ from datetime import datetime, timezone
 from typing import Any
 
 
+# standard LogRecord attributes, computed once rather than per log line
+_SKIP = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message"}
+
+
 class JSONFormatter(logging.Formatter):
     """Emit one JSON object per log line."""
 
@@ -20,9 +24,8 @@ class JSONFormatter(logging.Formatter):
             "msg": record.getMessage(),
         }
         # merge extra fields (skip standard LogRecord attributes)
-        _SKIP = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message"}
         for k, v in record.__dict__.items():
-            if k not in _SKIP and k != "msg" and k != "args":
+            if k not in _SKIP:
                 out[k] = v
         if record.exc_info and record.exc_info[1]:
             out["exception"] = self.formatException(record.exc_info)
@@ -124,24 +124,29 @@ async def save_speech_segments(
 ) -> list[UUID]:
     """
     Save speech segments to database.
+    Inserts all segments in a single statement (one round-trip per chunk)
+    by unnesting parallel start/end arrays.
     Returns list of created segment IDs.
     """
     if not segments:
         return []
 
-    segment_ids = []
-    for start_ms, end_ms in segments:
-        query = text("""
-            INSERT INTO speech_segments (chunk_id, start_ms, end_ms)
-            VALUES (:chunk_id, :start_ms, :end_ms)
-            RETURNING id
-        """)
-        result = await session.execute(
-            query,
-            {"chunk_id": chunk_id, "start_ms": start_ms, "end_ms": end_ms},
-        )
-        segment_id = result.scalar_one()
-        segment_ids.append(segment_id)
+    query = text("""
+        INSERT INTO speech_segments (chunk_id, start_ms, end_ms)
+        SELECT :chunk_id, s.start_ms, s.end_ms
+        FROM unnest(CAST(:starts AS integer[]), CAST(:ends AS integer[]))
+            AS s(start_ms, end_ms)
+        RETURNING id
+    """)
+    result = await session.execute(
+        query,
+        {
+            "chunk_id": chunk_id,
+            "starts": [start_ms for start_ms, _ in segments],
+            "ends": [end_ms for _, end_ms in segments],
+        },
+    )
+    segment_ids = list(result.scalars().all())
 
     logger.info(
         "Saved speech segments",